@@ -0,0 +1,43 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    """Answers every GET with the request's Cookie header as the body.
+
+    ``/set-cookie`` additionally sets ``sid=abc``; ``/search`` answers with a
+    small HTML page instead.
+    """
+
+    def do_GET(self) -> None:
+        if self.path.startswith("/search"):
+            body = b"<html><body><p>result</p></body></html>"
+        else:
+            body = (self.headers.get("Cookie") or "").encode()
+        self.send_response(200)
+        if self.path.startswith("/set-cookie"):
+            self.send_header("Set-Cookie", "sid=abc; Path=/")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture(scope="session")
+def local_server() -> Iterator[str]:
+    """Base URL of a throwaway HTTP server on localhost."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,27 @@
+"""Tests for the search HTTP client."""
+
+from __future__ import annotations
+
+from webscout.search.http_client import HttpClient
+
+
+def test_cookies_stay_with_the_client_that_received_them(local_server: str) -> None:
+    a = HttpClient()
+    b = HttpClient()
+    try:
+        # Both clients share one pooled session
+        assert a.client is b.client
+
+        a.get(f"{local_server}/set-cookie")
+
+        assert a.get(f"{local_server}/echo").text == "sid=abc"
+        assert b.get(f"{local_server}/echo").text == ""
+    finally:
+        a.close()
+        b.close()
+
+
+def test_request_cookies_are_merged_with_the_client_jar(local_server: str) -> None:
+    with HttpClient() as client:
+        client.get(f"{local_server}/set-cookie")
+        assert client.get(f"{local_server}/echo", cookies={"x": "1"}).text == "sid=abc; x=1"
@@ -0,0 +1,71 @@
+"""Tests for concurrent searches across engines."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from webscout.search.base import BaseSearchEngine, multi_search
+from webscout.search.results import TextResult
+
+
+class _LocalEngine(BaseSearchEngine[TextResult]):
+    """Minimal engine reading ``<p>`` items from the local test server."""
+
+    name = "local"
+    category = "text"
+    search_method = "GET"
+    items_xpath = "//p"
+    elements_xpath = {"title": ".//text()"}
+
+    def __init__(self, search_url: str) -> None:
+        super().__init__()
+        self.search_url = search_url
+
+    def build_payload(
+        self, query: str, region: str, safesearch: str, timelimit: str | None, page: int, **kwargs: Any
+    ) -> dict[str, Any]:
+        return {"q": query}
+
+
+@pytest.fixture
+def engines(local_server: str) -> list[_LocalEngine]:
+    return [_LocalEngine(f"{local_server}/search") for _ in range(2)]
+
+
+def test_multi_search_returns_results_per_engine(engines: list[_LocalEngine]) -> None:
+    results = asyncio.run(multi_search(engines, "query"))
+
+    assert [[r.title for r in result] for result in results] == [["result"], ["result"]]
+
+
+def test_multi_search_works_across_event_loops(engines: list[_LocalEngine]) -> None:
+    # Each asyncio.run() uses a fresh event loop; the engines must not stay
+    # bound to the first one
+    first = asyncio.run(multi_search(engines, "query"))
+    second = asyncio.run(multi_search(engines, "query"))
+
+    assert first == second
+    assert None not in second
+
+
+def test_multi_search_closes_async_sessions(engines: list[_LocalEngine]) -> None:
+    asyncio.run(multi_search(engines, "query"))
+
+    assert all(engine.http_client._async_client is None for engine in engines)
+    # The engines stay usable for synchronous searches
+    assert [r.title for r in engines[0].search("query")] == ["result"]
+
+
+def test_stale_async_session_is_closed_on_a_new_loop(local_server: str) -> None:
+    engine = _LocalEngine(f"{local_server}/search")
+    asyncio.run(engine.asearch("query"))
+    stale = engine.http_client._async_client
+
+    results = asyncio.run(engine.asearch("query"))
+
+    assert [r.title for r in results] == ["result"]
+    assert stale is not None and stale._closed
+    assert engine.http_client._async_client is not stale
@@ -0,0 +1,46 @@
+"""Tests for the API server's response serialization."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("uvicorn")
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from fastapi.routing import APIRoute  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from webscout.server.server import create_app  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return create_app()
+
+
+def _response_class(app, path: str) -> type:
+    route = next(r for r in app.routes if isinstance(r, APIRoute) and r.path == path)
+    # Routes without an explicit class hold a placeholder for the app default
+    return getattr(route.response_class, "value", route.response_class)
+
+
+@pytest.mark.parametrize("path", ["/v1/chat/completions", "/v1/images/generations", "/v1/models"])
+def test_chat_and_image_routes_keep_the_default_json_response(app, path: str) -> None:
+    assert _response_class(app, path) is JSONResponse
+
+
+def test_search_route_serializes_with_orjson(app) -> None:
+    assert _response_class(app, "/search") is ORJSONResponse
+
+    response = TestClient(app).get("/search", params={"q": "x", "engine": "nope"})
+
+    assert response.status_code == 200
+    assert response.json()["error"] == "Unknown engine. Use one of: yep, duckduckgo, bing."
+
+
+def test_health_check(app) -> None:
+    body = TestClient(app).get("/monitor/health").json()
+
+    assert body["status"] == "healthy"
+    assert body["timestamp"].endswith("+00:00")
@@ -0,0 +1,174 @@
+"""Tests for the Yahoo search engines, run against canned result pages."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from webscout.search.engines.yahoo.images import YahooImages
+from webscout.search.engines.yahoo.news import YahooNews
+from webscout.search.engines.yahoo.text import YahooText
+from webscout.search.engines.yahoo.videos import YahooVideos
+
+
+def _redirect(url: str) -> str:
+    return f"https://r.search.yahoo.com/_ylt=x/RU={url}/RK=2/RS=y"
+
+
+def _serve(engine: Any, pages: list[str]) -> list[tuple[str, dict[str, Any]]]:
+    """Answer the engine's requests with ``pages`` in order and log each URL and payload."""
+    calls: list[tuple[str, dict[str, Any]]] = []
+
+    def request(method: str, url: str, **kwargs: Any) -> str | None:
+        calls.append((url, kwargs.get("params", {})))
+        return pages[len(calls) - 1] if len(calls) <= len(pages) else None
+
+    engine.request = request
+    return calls
+
+
+def _text_page(*items: tuple[str, str]) -> str:
+    rows = "".join(
+        f"<div class='compTitle'><h3><a href='{_redirect(href)}'><span>{title}</span></a></h3></div>"
+        f"<div class='compText'>about {title}</div>"
+        for title, href in items
+    )
+    return f"<html><body>{rows}<a class='next' href='#'>Next</a></body></html>"
+
+
+TEXT_PAGES = [
+    _text_page(("One", "https://one.example"), ("Two", "https://two.example")),
+    # Yahoo repeats results across pages
+    _text_page(("Two again", "https://two.example"), ("Three", "https://three.example")),
+]
+
+
+def test_text_search_dedupes_across_pages() -> None:
+    engine = YahooText()
+    _serve(engine, TEXT_PAGES)
+
+    results = engine.search("query")
+
+    assert [r.href for r in results] == ["https://one.example", "https://two.example", "https://three.example"]
+    assert results[0].body == "about One"
+
+
+def test_text_search_dicts_matches_search() -> None:
+    engine = YahooText()
+    _serve(engine, TEXT_PAGES)
+
+    assert list(engine.search_dicts("query")) == [
+        {"title": "One", "href": "https://one.example", "body": "about One"},
+        {"title": "Two", "href": "https://two.example", "body": "about Two"},
+        {"title": "Three", "href": "https://three.example", "body": "about Three"},
+    ]
+
+
+def test_text_title_comes_from_heading_spans_only() -> None:
+    page = (
+        "<html><body><div class='compTitle'><h3>"
+        f"<a href='{_redirect('https://one.example')}'>one.example<b>›</b>"
+        "<span>Title <span>part</span></span></a></h3></div></body></html>"
+    )
+    engine = YahooText()
+    _serve(engine, [page])
+
+    assert [r.title for r in engine.search("query")] == ["Title part"]
+
+
+def test_text_search_stops_fetching_at_max_results() -> None:
+    engine = YahooText()
+    calls = _serve(engine, TEXT_PAGES)
+
+    results = engine.search("query", max_results=2)
+
+    assert [r.title for r in results] == ["One", "Two"]
+    assert len(calls) == 1
+
+
+def test_news_search_dedupes_across_pages() -> None:
+    page = (
+        "<html><body>"
+        f"<div class='NewsArticle'><h4><a href='{_redirect('https://a.example')}'>A</a></h4>"
+        "<span class='s-source'>Outlet via Yahoo</span></div>"
+        f"<div class='NewsArticle'><h4><a href='{_redirect('https://a.example')}'>A again</a></h4></div>"
+        "</body></html>"
+    )
+    engine = YahooNews()
+    _serve(engine, [page])
+
+    results = engine.search("query")
+
+    assert [(r.title, r.url, r.source) for r in results] == [("A", "https://a.example", "Outlet")]
+
+
+def test_news_tracking_tokens_are_per_query() -> None:
+    page = "<html><body><div class='NewsArticle'><h4><a href='https://a.example'>A</a></h4></div></body></html>"
+    engine = YahooNews()
+    calls = _serve(engine, [page, page, page])
+
+    engine.search("first", max_pages=2)
+    engine.search("second", max_pages=1)
+
+    urls = [url for url, _ in calls]
+    assert ";_ylt=" in urls[0]
+    # Pages of one query share tokens, a new query gets fresh ones, and the
+    # shared engine is left untouched
+    assert urls[0] == urls[1] != urls[2]
+    assert engine.search_url == YahooNews.search_url
+
+
+def test_videos_search_dedupes_across_pages() -> None:
+    page = (
+        "<html><body><div id='results'>"
+        "<div class='vr'><h3><a href='https://video.example/1'>First</a></h3></div>"
+        "<div class='vr'><h3><a href='https://video.example/1'>Repeat</a></h3></div>"
+        "<div class='vr'><h3><a href='https://video.example/2'>Second</a></h3></div>"
+        "</div></body></html>"
+    )
+    engine = YahooVideos()
+    _serve(engine, [page])
+
+    results = engine.search("query")
+
+    assert [r.title for r in results] == ["First", "Second"]
+
+
+def _images_page(*titles: str) -> str:
+    items = "".join(
+        f"<li class='ld' data='{json.dumps({'desc': t, 'rurl': f'https://{t}.example', 'imgW': '1', 'imgH': '2'})}'></li>"
+        for t in titles
+    )
+    return f"<html><body><ul>{items}</ul></body></html>"
+
+
+def test_images_search_parses_the_data_attribute() -> None:
+    engine = YahooImages()
+    _serve(engine, [_images_page("a", "b")])
+
+    results = engine.search("query")
+
+    assert [(r.title, r.url, r.width, r.height) for r in results] == [
+        ("a", "https://a.example", 1, 2),
+        ("b", "https://b.example", 1, 2),
+    ]
+
+
+def test_images_search_stops_fetching_at_max_results() -> None:
+    engine = YahooImages()
+    calls = _serve(engine, [_images_page("a", "b"), _images_page("c", "d")])
+
+    results = engine.search("query", max_results=2)
+
+    assert [r.title for r in results] == ["a", "b"]
+    assert len(calls) == 1
+
+
+def test_text_next_page_link_detection() -> None:
+    engine = YahooText()
+
+    assert engine.has_next_page("<a class=\"pg next\" href='#'>›</a>", 1)
+    assert engine.has_next_page("<a href='#'> 2 </a><a href='#'>3</a>", 1)
+    # Numbers that merely contain the next page's digits are not page links
+    assert not engine.has_next_page("<a href='#'>12</a><a href='#'>2024</a>", 1)
+    assert not engine.has_next_page("<a href='#'>1</a>", 1)
@@ -0,0 +1,44 @@
+"""Tests for the Yahoo weather engine, run against canned pages."""
+
+from __future__ import annotations
+
+from webscout.search.engines.yahoo.weather import YahooWeather
+
+
+def _page(payload: str) -> str:
+    """Wrap ``payload`` in a Next.js push script, escaped like Yahoo's pages."""
+    escaped = payload.replace('"', "\\u0022")
+    return f'<html><script>self.__next_f.push([1,"{escaped}"])</script></html>'
+
+
+def _run(page: str) -> list[dict]:
+    engine = YahooWeather()
+    engine.request = lambda method, url, **kwargs: page
+    return engine.run("Springfield")
+
+
+def test_location_only_payload_is_an_error() -> None:
+    page = _page('{"name":"Springfield","code":null,"woeid":12345}')
+
+    assert _run(page) == [{"location": "Springfield", "error": "Could not extract weather data from page"}]
+
+
+def test_payload_with_temperature_is_a_result() -> None:
+    page = _page('{"name":"Springfield","code":null,"woeid":12345,"temperature":71,"iconLabel":"Sunny"}')
+
+    result = _run(page)[0]
+
+    assert result["location"] == "Springfield"
+    assert result["woeid"] == 12345
+    assert result["temperature_f"] == 71
+    assert result["condition"] == "Sunny"
+
+
+def test_fallback_result_keeps_location_details() -> None:
+    page = _page('{"name":"Springfield","code":null,"woeid":12345,"highTemperature":80}')
+
+    result = _run(page)[0]
+
+    assert "error" not in result
+    assert result["high_f"] == 80
+    assert result["woeid"] == 12345
@@ -0,0 +1,36 @@
+"""Tests for the ZeroArt effects."""
+
+from __future__ import annotations
+
+import pytest
+
+from webscout.zeroart import figlet_format, glitch
+
+GLITCH_CHARS = set("~^`¯±")
+
+
+@pytest.mark.parametrize("intensity", [1e-17, 5e-324])
+def test_glitch_with_tiny_intensity_leaves_art_unchanged(intensity: float) -> None:
+    assert glitch("hi", glitch_intensity=intensity) == figlet_format("hi")
+
+
+@pytest.mark.parametrize("intensity", [0.0, -1.0])
+def test_glitch_without_intensity_leaves_art_unchanged(intensity: float) -> None:
+    assert glitch("hi", glitch_intensity=intensity) == figlet_format("hi")
+
+
+@pytest.mark.parametrize("intensity", [1.0, 2.0])
+def test_glitch_with_full_intensity_replaces_every_character(intensity: float) -> None:
+    art = figlet_format("hi")
+    glitched = glitch("hi", glitch_intensity=intensity)
+
+    glitched_lines = glitched.split("\n")
+    assert [len(line) for line in glitched_lines] == [len(line) for line in art.split("\n")]
+    assert set("".join(glitched_lines)) <= GLITCH_CHARS
+
+
+def test_glitch_keeps_line_structure() -> None:
+    art = figlet_format("hello")
+    glitched = glitch("hello", glitch_intensity=0.5)
+
+    assert [len(line) for line in glitched.split("\n")] == [len(line) for line in art.split("\n")]
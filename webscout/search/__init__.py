@@ -1,6 +1,6 @@
 """Webscout search module - unified search interfaces."""
 
-from .base import BaseSearch, BaseSearchEngine
+from .base import BaseSearch, BaseSearchEngine, multi_search
 from .duckduckgo_main import DuckDuckGoSearch
 from .yep_main import YepSearch
 from .bing_main import BingSearch
@@ -26,6 +26,7 @@ __all__ = [
     # Base classes
     "BaseSearch",
     "BaseSearchEngine",
+    "multi_search",
     
     # Main search interfaces
     "DuckDuckGoSearch",
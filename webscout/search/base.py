@@ -2,19 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
-from functools import cached_property
+from collections.abc import Iterable, Iterator, Mapping
+from functools import cached_property, lru_cache
 from typing import Any, Generic, Literal, TypeVar
 
 try:
     from lxml import html
     from lxml.etree import HTMLParser as LHTMLParser
+    from lxml.etree import XPath
     LXML_AVAILABLE = True
 except ImportError:
     LXML_AVAILABLE = False
     html = None  # type: ignore
+    XPath = None  # type: ignore
     LHTMLParser = None  # type: ignore
 
 from .http_client import HttpClient
@@ -24,6 +28,12 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=None)
+def compile_xpath(expr: str) -> Any:
+    """Compile an XPath expression once and reuse it for every query."""
+    return XPath(expr)
+
+
 class BaseSearchEngine(ABC, Generic[T]):
     """Abstract base class for all search engine backends."""
 
@@ -42,13 +52,22 @@ class BaseSearchEngine(ABC, Generic[T]):
 
     def __init__(self, proxy: str | None = None, timeout: int | None = None, verify: bool = True):
         """Initialize search engine.
+
+        The HTTP session lives for the lifetime of the engine, so every page of a
+        paginated search reuses the same pooled connection. ``search_headers`` are
+        installed as the client's default headers, so requests need not pass them.
         
         Args:
             proxy: Proxy URL (supports http/https/socks5).
             timeout: Request timeout in seconds.
             verify: Whether to verify SSL certificates.
         """
-        self.http_client = HttpClient(proxy=proxy, timeout=timeout, verify=verify)
+        self.http_client = HttpClient(
+            proxy=proxy,
+            timeout=timeout,
+            verify=verify,
+            headers=dict(self.search_headers),
+        )
         self.results: list[T] = []
 
     @property
@@ -70,6 +89,15 @@ class BaseSearchEngine(ABC, Generic[T]):
         """Build a payload for the search request."""
         raise NotImplementedError
 
+    def query_url(self) -> str:
+        """Get the URL to request for one query.
+
+        Called once per query and passed along to every page request, so
+        engines can add per-query parts (e.g. tracking tokens) without
+        storing them on the shared engine instance.
+        """
+        return self.search_url
+
     def request(self, method: str, url: str, **kwargs: Any) -> str | None:
         """Make a request to the search engine."""
         try:
@@ -79,6 +107,15 @@ class BaseSearchEngine(ABC, Generic[T]):
             logger.error("Error in %s request: %r", self.name, ex)
             return None
 
+    async def arequest(self, method: str, url: str, **kwargs: Any) -> str | None:
+        """Make a request to the search engine without blocking the event loop."""
+        try:
+            response = await self.http_client.arequest(method, url, **kwargs)
+            return response.text
+        except Exception as ex:
+            logger.error("Error in %s request: %r", self.name, ex)
+            return None
+
     @cached_property
     def parser(self) -> Any:
         """Get HTML parser."""
@@ -99,29 +136,38 @@ class BaseSearchEngine(ABC, Generic[T]):
 
     def extract_results(self, html_text: str) -> list[T]:
         """Extract search results from html text."""
+        return list(self.iter_results(html_text))
+
+    def iter_results(self, html_text: str) -> Iterator[T]:
+        """Lazily extract search results from html text, one item at a time.
+
+        Lets callers stop extracting as soon as they have enough results.
+        """
         if not LXML_AVAILABLE:
             raise ImportError("lxml is required for result extraction")
         
         html_text = self.pre_process_html(html_text)
         tree = self.extract_tree(html_text)
         
-        results = []
-        items = tree.xpath(self.items_xpath) if self.items_xpath else []
+        items = compile_xpath(self.items_xpath)(tree) if self.items_xpath else []
+        intern_fields = getattr(self.result_type, "_INTERN_FIELDS", frozenset())
         
         for item in items:
             result = self.result_type()
             for key, xpath in self.elements_xpath.items():
                 try:
-                    data = item.xpath(xpath)
+                    data = compile_xpath(xpath)(item)
                     if data:
                         # Join text nodes or get first attribute
                         value = "".join(data) if isinstance(data, list) else data
-                        setattr(result, key, value.strip() if isinstance(value, str) else value)
+                        if isinstance(value, str):
+                            value = value.strip()
+                            if key in intern_fields:
+                                value = sys.intern(value)
+                        setattr(result, key, value)
                 except Exception as ex:
                     logger.debug("Error extracting %s: %r", key, ex)
-            results.append(result)
-        
-        return results
+            yield result
 
     def post_extract_results(self, results: list[T]) -> list[T]:
         """Post-process search results."""
@@ -141,14 +187,52 @@ class BaseSearchEngine(ABC, Generic[T]):
             query=query, region=region, safesearch=safesearch, timelimit=timelimit, page=page, **kwargs
         )
         if self.search_method == "GET":
-            html_text = self.request(self.search_method, self.search_url, params=payload, headers=self.search_headers)
+            html_text = self.request(self.search_method, self.query_url(), params=payload)
         else:
-            html_text = self.request(self.search_method, self.search_url, data=payload, headers=self.search_headers)
+            html_text = self.request(self.search_method, self.query_url(), data=payload)
         if not html_text:
             return None
         results = self.extract_results(html_text)
         return self.post_extract_results(results)
 
+    async def asearch(
+        self,
+        query: str,
+        region: str = "us-en",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        page: int = 1,
+        **kwargs: Any,
+    ) -> list[T] | None:
+        """Search the engine asynchronously (single page, like :meth:`search`)."""
+        payload = self.build_payload(
+            query=query, region=region, safesearch=safesearch, timelimit=timelimit, page=page, **kwargs
+        )
+        if self.search_method == "GET":
+            html_text = await self.arequest(self.search_method, self.query_url(), params=payload)
+        else:
+            html_text = await self.arequest(self.search_method, self.query_url(), data=payload)
+        if not html_text:
+            return None
+        results = self.extract_results(html_text)
+        return self.post_extract_results(results)
+
+
+async def multi_search(
+    engines: Iterable[BaseSearchEngine[Any]], query: str, **kwargs: Any
+) -> list[list[Any] | None]:
+    """Query several engines concurrently.
+
+    Returns one entry per engine, in the order given, with ``None`` for
+    engines whose request failed. The engines' async sessions are bound to
+    the running event loop, so they are closed again before returning.
+    """
+    engines = list(engines)
+    try:
+        return list(await asyncio.gather(*(engine.asearch(query, **kwargs) for engine in engines)))
+    finally:
+        await asyncio.gather(*(engine.http_client.close_async_client() for engine in engines))
+
 
 # Legacy base class for backwards compatibility
 class BaseSearch(ABC):
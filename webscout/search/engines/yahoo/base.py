@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain
 from secrets import token_urlsafe
 from typing import Any, Generic, TypeVar
 
@@ -18,6 +20,7 @@ class YahooSearchEngine(BaseSearchEngine[T], Generic[T]):
 
     provider = "yahoo"
     _base_url = "https://search.yahoo.com"
+    max_pages: int = 10  # default page limit for paginated searches
     
     def generate_ylt_token(self) -> str:
         """Generate Yahoo _ylt tracking token."""
@@ -27,8 +30,95 @@ class YahooSearchEngine(BaseSearchEngine[T], Generic[T]):
         """Generate Yahoo _ylu tracking token."""
         return token_urlsafe(47 * 3 // 4)
     
+    def generate_tracking_tokens(self) -> tuple[str, str]:
+        """Generate the (_ylt, _ylu) token pair from a single random draw.
+
+        Slices one ``token_urlsafe`` string instead of encoding two, halving the
+        urandom/base64 round trips per page.
+        """
+        token = token_urlsafe((24 + 47) * 3 // 4 + 1)
+        return token[:24], token[24:71]
+
     def build_search_url(self, base_path: str) -> str:
         """Build search URL with tracking tokens."""
-        ylt = self.generate_ylt_token()
-        ylu = self.generate_ylu_token()
+        ylt, ylu = self.generate_tracking_tokens()
         return f"{self._base_url}/{base_path};_ylt={ylt};_ylu={ylu}"
+
+    def has_next_page(self, html_text: str, page: int) -> bool:
+        """Check whether another results page follows ``page``."""
+        return True
+
+    def _iter_pages(
+        self,
+        extract: Callable[[str], Iterable[Any]],
+        query: str,
+        region: str,
+        safesearch: str,
+        timelimit: str | None,
+        page: int,
+        **kwargs: Any,
+    ) -> Iterator[Iterator[Any]]:
+        """Fetch consecutive result pages and yield a lazy item iterator for each.
+
+        Items are only extracted as the caller consumes them, so a caller that
+        stops early skips the rest of the page. Stops at the first failed
+        request, empty page, missing next-page link or after ``max_pages`` pages.
+        """
+        current_page = page
+        search_url = self.query_url()
+        max_pages = kwargs.get("max_pages", self.max_pages)  # Limit to prevent infinite loops
+
+        while current_page <= max_pages:
+            # Build payload for current page
+            payload = self.build_payload(
+                query=query,
+                region=region,
+                safesearch=safesearch,
+                timelimit=timelimit,
+                page=current_page,
+                **kwargs
+            )
+
+            # Make request
+            html_text = self.request(self.search_method, search_url, params=payload)
+            if not html_text:
+                return
+
+            # Extract results from current page (``extract`` pre-processes it)
+            page_results = iter(extract(html_text))
+            first = next(page_results, None)
+            if first is None:
+                return
+
+            yield chain((first,), page_results)
+
+            # Look for next page link
+            if not self.has_next_page(html_text, current_page):
+                return
+
+            current_page += 1
+
+    def _iter_unique(
+        self,
+        results: Iterable[Any],
+        key: Callable[[Any], str],
+        max_results: int | None = None,
+    ) -> Iterator[Any]:
+        """Yield each result once, stopping after ``max_results`` results.
+
+        ``key`` cleans a result in place (e.g. decodes its redirect URL) and
+        returns the value results are deduplicated on, or an empty string for
+        incomplete results, which are skipped. Yahoo repeats results across
+        pages, so only the first occurrence of each key is kept.
+        """
+        seen: set[str] = set()
+        count = 0
+        for result in results:
+            value = key(result)
+            if not value or value in seen:
+                continue
+            seen.add(value)
+            yield result
+            count += 1
+            if max_results and count >= max_results:
+                return
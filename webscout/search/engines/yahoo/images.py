@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from itertools import chain, islice
 from typing import Any
 from urllib.parse import urljoin
 
 from .base import YahooSearchEngine
-from ...results import ImagesResult
+from ...results import ImagesResult, to_dicts
 
 
 class YahooImages(YahooSearchEngine[ImagesResult]):
@@ -30,6 +31,7 @@ class YahooImages(YahooSearchEngine[ImagesResult]):
 
     search_url = "https://images.search.yahoo.com/search/images"
     search_method = "GET"
+    max_pages = 5
     search_headers = {
         "User-Agent": "Mozilla/5.0 (iPhone; CPU iPhone OS 14_7_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.2 Mobile/15E148 Safari/604.1"
     }
@@ -239,42 +241,12 @@ class YahooImages(YahooSearchEngine[ImagesResult]):
         Returns:
             List of ImageResult objects
         """
-        results = []
-        current_page = page
-        max_pages = kwargs.get("max_pages", 5)
-        
-        while current_page <= max_pages:
-            payload = self.build_payload(
-                query=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                page=current_page,
-                **kwargs
-            )
-            
-            html_text = self.request(self.search_method, self.search_url, params=payload)
-            if not html_text:
-                break
-            
-            html_text = self.pre_process_html(html_text)
-            page_results = self.extract_results(html_text)
-            
-            if not page_results:
-                break
-            
-            results.extend(page_results)
-            
-            if max_results and len(results) >= max_results:
-                break
-            
-            current_page += 1
+        pages = self._iter_pages(self.iter_results, query, region, safesearch, timelimit, page, **kwargs)
+        # Stop fetching and parsing pages as soon as we have enough results
+        results = list(islice(chain.from_iterable(pages), max_results or None))
         
         results = self.post_extract_results(results)
         
-        if max_results:
-            results = results[:max_results]
-        
         return results if results else None
 
     def run(
@@ -321,4 +293,4 @@ class YahooImages(YahooSearchEngine[ImagesResult]):
         )
         if results is None:
             return []
-        return [result.to_dict() for result in results]
+        return to_dicts(results)
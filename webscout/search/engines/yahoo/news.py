@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Mapping
-from secrets import token_urlsafe
+from itertools import chain
 from typing import Any
+from urllib.parse import unquote
 
 from .base import YahooSearchEngine
-from ...results import NewsResult
+from ...results import NewsResult, to_dicts
 
 
 def extract_image(u: str) -> str:
@@ -36,12 +38,31 @@ def extract_source(s: str) -> str:
         s: Source string
         
     Returns:
-        Cleaned source name
+        Cleaned source name, interned since a handful of outlets repeat
     """
     if not s:
         return s
     
-    return s.replace(" via Yahoo", "").replace(" - Yahoo", "").strip()
+    return sys.intern(s.replace(" via Yahoo", "").replace(" - Yahoo", "").strip())
+
+
+def extract_url(u: str) -> str:
+    """Extract the article URL from a Yahoo /RU= redirect.
+    
+    Args:
+        u: Article URL, possibly wrapped in a Yahoo redirect
+        
+    Returns:
+        Decoded target URL
+    """
+    if not u or "/RU=" not in u:
+        return u
+    
+    start = u.find("/RU=") + 4
+    end = u.find("/RK=", start)
+    if end == -1:
+        end = len(u)
+    return unquote(u[start:end])
 
 
 class YahooNews(YahooSearchEngine[NewsResult]):
@@ -72,6 +93,17 @@ class YahooNews(YahooSearchEngine[NewsResult]):
         "source": ".//span[contains(@class, 's-source') or contains(@class, 'source')]//text()",
     }
 
+    def query_url(self) -> str:
+        """Get the search URL with fresh tracking tokens for one query.
+        
+        Every page of the query is requested with the same tokens.
+        
+        Returns:
+            Tokenized search URL
+        """
+        ylt, ylu = self.generate_tracking_tokens()
+        return f"{self.search_url};_ylt={ylt};_ylu={ylu}"
+
     def build_payload(
         self,
         query: str,
@@ -94,13 +126,6 @@ class YahooNews(YahooSearchEngine[NewsResult]):
         Returns:
             Query parameters dictionary
         """
-        # Generate dynamic URL tokens for tracking
-        self.search_url = (
-            f"https://news.search.yahoo.com/search"
-            f";_ylt={token_urlsafe(24 * 3 // 4)}"
-            f";_ylu={token_urlsafe(47 * 3 // 4)}"
-        )
-        
         payload = {
             "p": query,
             "ei": "UTF-8",
@@ -131,6 +156,11 @@ class YahooNews(YahooSearchEngine[NewsResult]):
         
         return payload
 
+    def _dedupe_key(self, result: NewsResult) -> str:
+        """Decode the article's redirect URL and return it, or "" if incomplete."""
+        result.url = extract_url(result.url)
+        return result.url if result.title else ""
+
     def post_extract_results(self, results: list[NewsResult]) -> list[NewsResult]:
         """Post-process news results.
         
@@ -150,13 +180,7 @@ class YahooNews(YahooSearchEngine[NewsResult]):
             result.source = extract_source(result.source)
             
             # Extract URL from redirect
-            if result.url and "/RU=" in result.url:
-                from urllib.parse import unquote
-                start = result.url.find("/RU=") + 4
-                end = result.url.find("/RK=", start)
-                if end == -1:
-                    end = len(result.url)
-                result.url = unquote(result.url[start:end])
+            result.url = extract_url(result.url)
             
             # Filter out results without essential fields
             if result.title and result.url:
@@ -188,36 +212,10 @@ class YahooNews(YahooSearchEngine[NewsResult]):
         Returns:
             List of NewsResult objects
         """
-        results = []
-        current_page = page
-        max_pages = kwargs.get("max_pages", 10)
-        
-        while current_page <= max_pages:
-            payload = self.build_payload(
-                query=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                page=current_page,
-                **kwargs
-            )
-            
-            html_text = self.request(self.search_method, self.search_url, params=payload)
-            if not html_text:
-                break
-            
-            html_text = self.pre_process_html(html_text)
-            page_results = self.extract_results(html_text)
-            
-            if not page_results:
-                break
-            
-            results.extend(page_results)
-            
-            if max_results and len(results) >= max_results:
-                break
-            
-            current_page += 1
+        pages = self._iter_pages(self.iter_results, query, region, safesearch, timelimit, page, **kwargs)
+        # Yahoo repeats stories across pages; keep the first occurrence of
+        # each decoded article URL and stop once we have enough results
+        results = list(self._iter_unique(chain.from_iterable(pages), self._dedupe_key, max_results))
         
         results = self.post_extract_results(results)
         
@@ -255,4 +253,4 @@ class YahooNews(YahooSearchEngine[NewsResult]):
         )
         if results is None:
             return []
-        return [result.to_dict() for result in results]
+        return to_dicts(results)
@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+import re
+from collections.abc import Iterator, Mapping
+from itertools import chain
 from typing import Any
 from urllib.parse import unquote_plus, urljoin
 
 from .base import YahooSearchEngine
+from ...base import compile_xpath
 from ...results import TextResult
 
+# Matches a "Next" pagination anchor, either by its text or its CSS class.
+# Scanning the raw HTML is much cheaper than a second XPath pass over the tree.
+_NEXT_PAGE_RE = re.compile(r"<a\b[^>]*\bclass=\"[^\"]*next|<a\b[^>]*>[^<]*Next")
+# Numbered pagination anchor; the page number is captured so it can be
+# compared exactly rather than matched as a substring of other link text
+_PAGE_LINK_RE = re.compile(r"<a\b[^>]*>\s*(\d+)\s*</a>")
+
 
 def extract_url(u: str) -> str:
     """Extract and sanitize URL from Yahoo redirect.
@@ -95,6 +105,52 @@ class YahooText(YahooSearchEngine[TextResult]):
             
         return payload
 
+    def _iter_fields(self, html_text: str) -> Iterator[tuple[str, str, str]]:
+        """Yield ``(title, href, body)`` for every result item on a page.
+
+        Each item is visited once: the title comes from the text of the spans
+        in its ``h3`` (other heading text such as breadcrumbs is skipped), the
+        link via an ElementPath lookup and the body from the first following
+        ``compText`` sibling, instead of evaluating one XPath per field.
+        """
+        html_text = self.pre_process_html(html_text)
+        tree = self.extract_tree(html_text)
+        title_xpath = compile_xpath(self.elements_xpath["title"])
+
+        for item in compile_xpath(self.items_xpath)(tree):
+            title = "".join(title_xpath(item)).strip()
+
+            a = item.find(".//a")
+            href = (a.get("href") or "") if a is not None else ""
+
+            body = ""
+            for sibling in item.itersiblings("div"):
+                if "compText" in (sibling.get("class") or ""):
+                    body = "".join(sibling.itertext()).strip()
+                    break
+
+            yield title, href, body
+
+    def iter_results(self, html_text: str) -> Iterator[TextResult]:
+        """Lazily extract search results from html text."""
+        for title, href, body in self._iter_fields(html_text):
+            yield TextResult(title=title, href=href, body=body)
+
+    def extract_results_as_dicts(self, html_text: str) -> Iterator[dict[str, Any]]:
+        """Extract search results from html text as plain dictionaries."""
+        for title, href, body in self._iter_fields(html_text):
+            yield {"title": title, "href": href, "body": body}
+
+    def _dedupe_key(self, result: TextResult) -> str:
+        """Decode the result's redirect link and return it, or "" if incomplete."""
+        result.href = extract_url(result.href)
+        return result.href if result.title else ""
+
+    def _dict_dedupe_key(self, result: dict[str, str]) -> str:
+        """Same as :meth:`_dedupe_key` for a result dictionary."""
+        href = result["href"] = extract_url(result["href"])
+        return href if result["title"] else ""
+
     def post_extract_results(self, results: list[TextResult]) -> list[TextResult]:
         """Post-process and clean extracted results.
         
@@ -144,52 +200,12 @@ class YahooText(YahooSearchEngine[TextResult]):
         Returns:
             List of TextResult objects, or None if search fails
         """
-        results = []
-        current_page = page
-        max_pages = kwargs.get("max_pages", 10)  # Limit to prevent infinite loops
-        
-        while current_page <= max_pages:
-            # Build payload for current page
-            payload = self.build_payload(
-                query=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                page=current_page,
-                **kwargs
-            )
-            
-            # Make request
-            html_text = self.request(self.search_method, self.search_url, params=payload)
-            if not html_text:
-                break
-            
-            # Pre-process HTML
-            html_text = self.pre_process_html(html_text)
-            
-            # Extract results from current page
-            page_results = self.extract_results(html_text)
-            if not page_results:
-                break
-            
-            results.extend(page_results)
-            
-            # Check if we have enough results
-            if max_results and len(results) >= max_results:
-                break
-            
-            # Look for next page link
-            tree = self.extract_tree(html_text)
-            next_links = tree.xpath("//a[contains(text(), 'Next') or contains(@class, 'next')]/@href")
-            
-            if not next_links:
-                # Try to find numbered page links
-                page_links = tree.xpath(f"//a[contains(text(), '{current_page + 1}')]/@href")
-                if not page_links:
-                    break
-            
-            current_page += 1
-        
+        pages = self._iter_pages(self.iter_results, query, region, safesearch, timelimit, page, **kwargs)
+        # Decode redirects up front so the same target reached through
+        # different Yahoo tracking wrappers is only kept once; extraction
+        # stops as soon as we have enough results
+        results = list(self._iter_unique(chain.from_iterable(pages), self._dedupe_key, max_results))
+
         # Post-process all results
         results = self.post_extract_results(results)
         
@@ -199,6 +215,46 @@ class YahooText(YahooSearchEngine[TextResult]):
         
         return results if results else None
 
+    def search_dicts(
+        self,
+        query: str,
+        region: str = "us-en",
+        safesearch: str = "moderate",
+        timelimit: str | None = None,
+        page: int = 1,
+        max_results: int | None = None,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, str]]:
+        """Search Yahoo and yield cleaned results as dictionaries.
+
+        Same pagination and cleaning as :meth:`search`, but results are built
+        directly as dicts without intermediate ``TextResult`` objects.
+
+        Args:
+            query: Search query string
+            region: Region code
+            safesearch: Safe search level
+            timelimit: Time filter (d=day, w=week, m=month, y=year)
+            page: Starting page number
+            max_results: Maximum number of results to yield
+            **kwargs: Additional search parameters
+
+        Yields:
+            Result dictionaries with ``title``, ``href`` and ``body`` keys
+        """
+        pages = self._iter_pages(
+            self.extract_results_as_dicts, query, region, safesearch, timelimit, page, **kwargs
+        )
+        yield from self._iter_unique(chain.from_iterable(pages), self._dict_dedupe_key, max_results)
+
+    def has_next_page(self, html_text: str, page: int) -> bool:
+        """Check whether the results page links to a following page."""
+        if _NEXT_PAGE_RE.search(html_text):
+            return True
+        # Try to find a numbered link to the following page
+        next_page = page + 1
+        return any(int(match.group(1)) == next_page for match in _PAGE_LINK_RE.finditer(html_text))
+
     def search_page(
         self,
         query: str,
@@ -234,7 +290,6 @@ class YahooText(YahooSearchEngine[TextResult]):
         if not html_text:
             return None
         
-        html_text = self.pre_process_html(html_text)
         results = self.extract_results(html_text)
         
         return self.post_extract_results(results) if results else None
@@ -261,13 +316,10 @@ class YahooText(YahooSearchEngine[TextResult]):
         Returns:
             List of search result dictionaries.
         """
-        results = self.search(
+        return list(self.search_dicts(
             query=keywords,
             region=region,
             safesearch=safesearch,
             timelimit=timelimit,
             max_results=max_results,
-        )
-        if results is None:
-            return []
-        return [result.to_dict() for result in results]
+        ))
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from itertools import chain
 from typing import Any
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs, unquote, urlparse
 
 from .base import YahooSearchEngine
-from ...results import VideosResult
+from ...results import VideosResult, to_dicts
 
 
 class YahooVideos(YahooSearchEngine[VideosResult]):
@@ -26,6 +27,7 @@ class YahooVideos(YahooSearchEngine[VideosResult]):
 
     search_url = "https://video.search.yahoo.com/search/video"
     search_method = "GET"
+    max_pages = 5
 
     # XPath selectors for video results
     items_xpath = "//div[@id='results']//div[contains(@class, 'dd') or contains(@class, 'vr')]"
@@ -147,30 +149,30 @@ class YahooVideos(YahooSearchEngine[VideosResult]):
         """
         if not href:
             return href
-            
-        try:
-            # Parse the URL
-            parsed = urlparse(href)
-            
-            # Check if it's a Yahoo redirect
-            if "r.search.yahoo.com" in parsed.netloc or "/RU=" in href:
-                # Extract the RU parameter
-                if "/RU=" in href:
-                    start = href.find("/RU=") + 4
-                    end = href.find("/RK=", start)
-                    if end == -1:
-                        end = len(href)
-                    from urllib.parse import unquote
-                    return unquote(href[start:end])
-                else:
-                    query_params = parse_qs(parsed.query)
-                    if "url" in query_params:
-                        return query_params["url"][0]
-            
+
+        # Most video links point straight at the host (YouTube, Vimeo, ...),
+        # so only pay for URL parsing when it is actually a Yahoo redirect.
+        if "/RU=" in href:
+            start = href.find("/RU=") + 4
+            end = href.find("/RK=", start)
+            if end == -1:
+                end = len(href)
+            return unquote(href[start:end])
+
+        if "r.search.yahoo.com" not in href:
             return href
+
+        try:
+            query_params = parse_qs(urlparse(href).query)
+            return query_params.get("url", [href])[0]
         except Exception:
             return href
 
+    def _dedupe_key(self, result: VideosResult) -> str:
+        """Resolve the video's real URL and return it, or "" if incomplete."""
+        result.url = self.extract_video_url(result.url)
+        return result.url if result.title else ""
+
     def post_extract_results(self, results: list[VideosResult]) -> list[VideosResult]:
         """Post-process video results.
         
@@ -223,36 +225,10 @@ class YahooVideos(YahooSearchEngine[VideosResult]):
         Returns:
             List of VideoResult objects
         """
-        results = []
-        current_page = page
-        max_pages = kwargs.get("max_pages", 5)
-        
-        while current_page <= max_pages:
-            payload = self.build_payload(
-                query=query,
-                region=region,
-                safesearch=safesearch,
-                timelimit=timelimit,
-                page=current_page,
-                **kwargs
-            )
-            
-            html_text = self.request(self.search_method, self.search_url, params=payload)
-            if not html_text:
-                break
-            
-            html_text = self.pre_process_html(html_text)
-            page_results = self.extract_results(html_text)
-            
-            if not page_results:
-                break
-            
-            results.extend(page_results)
-            
-            if max_results and len(results) >= max_results:
-                break
-            
-            current_page += 1
+        pages = self._iter_pages(self.iter_results, query, region, safesearch, timelimit, page, **kwargs)
+        # Skip videos already collected from an earlier page and stop once
+        # we have enough results
+        results = list(self._iter_unique(chain.from_iterable(pages), self._dedupe_key, max_results))
         
         results = self.post_extract_results(results)
         
@@ -299,4 +275,4 @@ class YahooVideos(YahooSearchEngine[VideosResult]):
         )
         if results is None:
             return []
-        return [result.to_dict() for result in results]
+        return to_dicts(results)
@@ -5,9 +5,59 @@ from __future__ import annotations
 import re
 import json
 from typing import Any
+from urllib.parse import quote_plus
 
 from ...http_client import HttpClient
 
+_SEARCH_URL = "https://weather.yahoo.com/search/?q="
+
+# Embedded Next.js payload chunks: self.__next_f.push([1,"..JSON data.."])
+_JSON_PUSH_RE = re.compile(r'self\.__next_f\.push\(\[1,"([^"]+)"\]\)')
+
+# The pushed payloads are still JSON-string escaped, so quotes inside them
+# show up as \u0022 (or \"). Fields are matched against the escaped text
+# directly and only the short captured strings are unescaped afterwards.
+_Q = r'(?:\\u0022|\\?")'
+_TEXT = r'(?:[^"\\]|\\(?!u0022)[^"])+'
+
+# Fields in the JSON payload, matched in a single scan. The group name of
+# each alternative is the ``weather_info`` key it fills.
+_FIELDS_RE = re.compile(
+    rf'{_Q}temperature{_Q}:(?P<temperature>\d+)'
+    rf'|{_Q}iconLabel{_Q}:{_Q}(?P<condition>{_TEXT}){_Q}'
+    rf'|{_Q}highTemperature{_Q}:(?P<high>\d+)'
+    rf'|{_Q}lowTemperature{_Q}:(?P<low>\d+)'
+    rf'|{_Q}probabilityOfPrecipitation{_Q}:{_Q}(?P<precipitation_chance>\d+)%{_Q}'
+    rf'|{_Q}name{_Q}:{_Q}(?P<location_name>{_TEXT}){_Q},{_Q}code{_Q}:null,{_Q}woeid{_Q}:(?P<woeid>\d+)'
+)
+# Humidity spans a whole JSON object, so it would swallow other fields if it
+# were part of the alternation above
+_HUMIDITY_RE = re.compile(rf'{_Q}value{_Q}:{_Q}(\d+)%{_Q}[^}}]*{_Q}category{_Q}:{_Q}Humidity{_Q}')
+
+_TEMP_RE = re.compile(r'"temperature":(\d+)')
+_HIGH_RE = re.compile(r'"highTemperature":(\d+)')
+_LOW_RE = re.compile(r'"lowTemperature":(\d+)')
+
+# Fallback patterns for the rendered HTML, tried in order
+_HTML_TEMP_RES = (
+    re.compile(r'<p[^>]*class="[^"]*font-title1[^"]*"[^>]*>(\d+)°</p>'),
+    re.compile(r'>(\d+)°<'),
+    _TEMP_RE,
+)
+_HTML_CONDITION_RES = (
+    re.compile(r'"iconLabel":"([^"]+)"', re.IGNORECASE),
+    re.compile(r'aria-label="([^"]*(?:Cloudy|Sunny|Rain|Clear|Thunder|Shower|Fog)[^"]*)"', re.IGNORECASE),
+)
+_HTML_HUMIDITY_RE = re.compile(r'Humidity[^>]*>(\d+)%|"value":"(\d+)%"[^}]*"Humidity"', re.IGNORECASE)
+
+# Result keys that carry actual weather; a page yielding none of them failed
+_WEATHER_FIELDS = ("temperature_f", "condition", "high_f", "low_f", "humidity_percent")
+
+
+def _unescape(value: str) -> str:
+    """Decode JSON string escapes in a captured payload value."""
+    return value.encode().decode('unicode_escape')
+
 
 class YahooWeather:
     """Yahoo weather search using embedded JSON extraction."""
@@ -46,7 +96,7 @@ class YahooWeather:
         
         try:
             # Use the search endpoint which redirects to the correct weather page
-            search_url = f"https://weather.yahoo.com/search/?q={location.replace(' ', '+')}"
+            search_url = _SEARCH_URL + quote_plus(location)
             
             # Fetch the page
             response = self.request("GET", search_url)
@@ -56,14 +106,10 @@ class YahooWeather:
                     "error": "Failed to fetch weather data from Yahoo"
                 }]
             
-            # Extract JSON data from the page
-            weather_data = self._extract_json_data(response, location)
-            
-            if weather_data:
-                return [weather_data]
-            
-            # Fallback: try regex parsing
-            return self._parse_weather_html(response, location)
+            # Extract JSON data from the page; the HTML fallback only looks
+            # for whatever the JSON pass could not find
+            partial = self._extract_json_data(response, location)
+            return self._parse_weather_html(response, location, partial)
             
         except Exception as e:
             return [{
@@ -71,133 +117,115 @@ class YahooWeather:
                 "error": f"Failed to fetch weather data: {str(e)}"
             }]
     
-    def _extract_json_data(self, html: str, location: str) -> dict[str, Any] | None:
+    def _extract_json_data(self, html: str, location: str) -> dict[str, Any]:
         """Extract weather data from embedded JSON in the page.
         
         Yahoo Weather embeds JSON data in script tags that can be parsed.
+        Always returns the (possibly partial) fields found, keyed like the
+        final result, so the HTML fallback can fill in only what is missing.
         """
         try:
             # Look for the main data script tag
             # Pattern: self.__next_f.push([1,"..JSON data.."])
-            json_pattern = r'self\.__next_f\.push\(\[1,"([^"]+)"\]\)'
-            matches = re.findall(json_pattern, html)
-            
             weather_info = {}
             
-            for match in matches:
-                # Unescape the JSON string
+            # Stream the payloads so each one can be freed once scanned
+            for push_match in _JSON_PUSH_RE.finditer(html):
+                match = push_match.group(1)
                 try:
-                    # The data is escaped, so we need to decode it
-                    decoded = match.encode().decode('unicode_escape')
-                    
-                    # Look for temperature data
-                    temp_match = re.search(r'"temperature":(\d+)', decoded)
-                    if temp_match and not weather_info.get('temperature'):
-                        weather_info['temperature'] = int(temp_match.group(1))
-                    
-                    # Look for condition
-                    condition_match = re.search(r'"iconLabel":"([^"]+)"', decoded)
-                    if condition_match and not weather_info.get('condition'):
-                        weather_info['condition'] = condition_match.group(1)
-                    
-                    # Look for high/low
-                    high_match = re.search(r'"highTemperature":(\d+)', decoded)
-                    if high_match and not weather_info.get('high'):
-                        weather_info['high'] = int(high_match.group(1))
-                    
-                    low_match = re.search(r'"lowTemperature":(\d+)', decoded)
-                    if low_match and not weather_info.get('low'):
-                        weather_info['low'] = int(low_match.group(1))
+                    for field_match in _FIELDS_RE.finditer(match):
+                        key = field_match.lastgroup
+                        if key == 'woeid':
+                            # Location name and WOEID come from the same match
+                            if not weather_info.get('location_name'):
+                                weather_info['location_name'] = _unescape(field_match.group('location_name'))
+                                weather_info['woeid'] = int(field_match.group('woeid'))
+                        elif key == 'condition':
+                            if not weather_info.get(key):
+                                weather_info[key] = _unescape(field_match.group(key))
+                        elif not weather_info.get(key):
+                            weather_info[key] = int(field_match.group(key))
                     
                     # Look for humidity
-                    humidity_match = re.search(r'"value":"(\d+)%"[^}]*"category":"Humidity"', decoded)
+                    humidity_match = _HUMIDITY_RE.search(match)
                     if humidity_match and not weather_info.get('humidity'):
                         weather_info['humidity'] = int(humidity_match.group(1))
                     
-                    # Look for precipitation probability
-                    precip_match = re.search(r'"probabilityOfPrecipitation":"(\d+)%"', decoded)
-                    if precip_match and not weather_info.get('precipitation_chance'):
-                        weather_info['precipitation_chance'] = int(precip_match.group(1))
-                    
-                    # Look for location name
-                    location_match = re.search(r'"name":"([^"]+)","code":null,"woeid":(\d+)', decoded)
-                    if location_match and not weather_info.get('location_name'):
-                        weather_info['location_name'] = location_match.group(1)
-                        weather_info['woeid'] = int(location_match.group(2))
-                    
                 except Exception:
                     continue
             
-            if weather_info and weather_info.get('temperature'):
-                return {
-                    "location": weather_info.get('location_name', location),
-                    "woeid": weather_info.get('woeid'),
-                    "temperature_f": weather_info.get('temperature'),
-                    "condition": weather_info.get('condition'),
-                    "high_f": weather_info.get('high'),
-                    "low_f": weather_info.get('low'),
-                    "humidity_percent": weather_info.get('humidity'),
-                    "precipitation_chance": weather_info.get('precipitation_chance'),
-                    "source": "Yahoo Weather",
-                    "units": "Fahrenheit"
-                }
-            
-            return None
+            return {
+                "location": weather_info.get('location_name', location),
+                "woeid": weather_info.get('woeid'),
+                "temperature_f": weather_info.get('temperature'),
+                "condition": weather_info.get('condition'),
+                "high_f": weather_info.get('high'),
+                "low_f": weather_info.get('low'),
+                "humidity_percent": weather_info.get('humidity'),
+                "precipitation_chance": weather_info.get('precipitation_chance'),
+                "source": "Yahoo Weather",
+                "units": "Fahrenheit"
+            }
             
-        except Exception as e:
-            return None
+        except Exception:
+            return {}
     
-    def _parse_weather_html(self, html_content: str, location: str) -> list[dict[str, Any]]:
+    def _parse_weather_html(
+        self, html_content: str, location: str, partial: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
         """Fallback: Parse weather data from HTML content using regex.
         
         Args:
             html_content: HTML content of weather page
             location: Location name
+            partial: Fields already extracted from the embedded JSON; only
+                missing fields are searched for
             
         Returns:
             List of weather data dictionaries
         """
+        # The JSON pass found the current temperature, so it is complete
+        if partial and partial.get("temperature_f"):
+            return [partial]
+        
         try:
             weather_data = {"location": location}
+            if partial:
+                weather_data.update(
+                    (k, v) for k, v in partial.items() if v is not None and k not in ("source", "units")
+                )
             
             # Extract current temperature
-            temp_patterns = [
-                r'<p[^>]*class="[^"]*font-title1[^"]*"[^>]*>(\d+)°</p>',
-                r'>(\d+)°<',
-                r'"temperature":(\d+)',
-            ]
-            
-            for pattern in temp_patterns:
-                match = re.search(pattern, html_content)
+            for pattern in _HTML_TEMP_RES:
+                match = pattern.search(html_content)
                 if match:
                     weather_data["temperature_f"] = int(match.group(1))
                     break
             
             # Extract condition
-            condition_patterns = [
-                r'"iconLabel":"([^"]+)"',
-                r'aria-label="([^"]*(?:Cloudy|Sunny|Rain|Clear|Thunder|Shower|Fog)[^"]*)"',
-            ]
-            
-            for pattern in condition_patterns:
-                match = re.search(pattern, html_content, re.IGNORECASE)
-                if match:
-                    weather_data["condition"] = match.group(1)
-                    break
+            if weather_data.get("condition") is None:
+                for pattern in _HTML_CONDITION_RES:
+                    match = pattern.search(html_content)
+                    if match:
+                        weather_data["condition"] = match.group(1)
+                        break
             
             # Extract high/low
-            high_match = re.search(r'"highTemperature":(\d+)', html_content)
-            if high_match:
-                weather_data["high_f"] = int(high_match.group(1))
+            if weather_data.get("high_f") is None:
+                high_match = _HIGH_RE.search(html_content)
+                if high_match:
+                    weather_data["high_f"] = int(high_match.group(1))
             
-            low_match = re.search(r'"lowTemperature":(\d+)', html_content)
-            if low_match:
-                weather_data["low_f"] = int(low_match.group(1))
+            if weather_data.get("low_f") is None:
+                low_match = _LOW_RE.search(html_content)
+                if low_match:
+                    weather_data["low_f"] = int(low_match.group(1))
             
             # Extract humidity
-            humidity_match = re.search(r'Humidity[^>]*>(\d+)%|"value":"(\d+)%"[^}]*"Humidity"', html_content, re.IGNORECASE)
-            if humidity_match:
-                weather_data["humidity_percent"] = int(humidity_match.group(1) or humidity_match.group(2))
+            if weather_data.get("humidity_percent") is None:
+                humidity_match = _HTML_HUMIDITY_RE.search(html_content)
+                if humidity_match:
+                    weather_data["humidity_percent"] = int(humidity_match.group(1) or humidity_match.group(2))
             
             weather_data["source"] = "Yahoo Weather"
             weather_data["units"] = "Fahrenheit"
@@ -205,7 +233,8 @@ class YahooWeather:
             # Remove None values
             weather_data = {k: v for k, v in weather_data.items() if v is not None}
             
-            if len(weather_data) > 3:  # Has more than just location, source, and units
+            # Location details alone (e.g. name and WOEID) are not a result
+            if any(key in weather_data for key in _WEATHER_FIELDS):
                 return [weather_data]
             
             return [{
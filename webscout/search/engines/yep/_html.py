@@ -0,0 +1,23 @@
+"""HTML helpers shared by the Yep search engines."""
+
+from __future__ import annotations
+
+import re
+from html import unescape
+
+# A tag, an unterminated trailing tag, or a stray closing bracket
+_TAG_RE = re.compile(r"<[^>]*>?|>")
+# Yep uses &nbsp; as a plain word separator
+_NBSP_TABLE = str.maketrans({"\xa0": " "})
+
+
+def strip_html(text: str) -> str:
+    """Remove HTML tags and decode entities in a Yep title or snippet."""
+    # Most snippets carry no markup at all; skip the regex pass for them
+    if "<" in text or ">" in text:
+        text = _TAG_RE.sub("", text)
+    if "&" in text:
+        text = unescape(text)
+    if "\xa0" in text:
+        text = text.translate(_NBSP_TABLE)
+    return text.strip()
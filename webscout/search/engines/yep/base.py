@@ -1,8 +1,27 @@
 from __future__ import annotations
 
+from itertools import cycle
+from typing import Iterator
+
 from ....litagent import LitAgent
 from curl_cffi.requests import Session
 
+_FINGERPRINT_POOL_SIZE = 8
+_fingerprints: Iterator[dict[str, str]] | None = None
+
+
+def _next_fingerprint() -> dict[str, str]:
+    """Return the next header fingerprint from a small, lazily built pool.
+
+    Generating a fingerprint is far more expensive than the rest of the
+    constructor, so a handful are built once and rotated between instances.
+    """
+    global _fingerprints
+    if _fingerprints is None:
+        agent = LitAgent()
+        _fingerprints = cycle([agent.generate_fingerprint() for _ in range(_FINGERPRINT_POOL_SIZE)])
+    return next(_fingerprints)
+
 
 class YepBase:
     """Base class for Yep search engines."""
@@ -24,7 +43,7 @@ class YepBase:
         )
         self.session.headers.update(
             {
-                **LitAgent().generate_fingerprint(),
+                **_next_fingerprint(),
                 "Origin": "https://yep.com",
                 "Referer": "https://yep.com/",
             }
@@ -3,8 +3,22 @@ from __future__ import annotations
 from typing import Dict, List, Optional
 from urllib.parse import urlencode
 
+from ....utils import json_loads
+from ._html import strip_html
 from .base import YepBase
 
+_SAFE_SEARCH = frozenset(("on", "moderate", "off"))
+
+
+def _second_srcset_url(srcset: str) -> str:
+    # URL of the second "<url> <descriptor>" candidate, sliced out with find()
+    # rather than splitting the whole srcset
+    start = srcset.find(",") + 1
+    end = srcset.find(",", start)
+    candidate = srcset[start:end if end != -1 else len(srcset)].strip()
+    space = candidate.find(" ")
+    return candidate[:space] if space != -1 else candidate
+
 
 class YepImages(YepBase):
     def run(self, *args, **kwargs) -> List[Dict[str, str]]:
@@ -13,12 +27,9 @@ class YepImages(YepBase):
         safesearch = args[2] if len(args) > 2 else kwargs.get("safesearch", "moderate")
         max_results = args[3] if len(args) > 3 else kwargs.get("max_results")
 
-        safe_search_map = {
-            "on": "on",
-            "moderate": "moderate",
-            "off": "off"
-        }
-        safe_setting = safe_search_map.get(safesearch.lower(), "moderate")
+        safe_setting = safesearch.lower()
+        if safe_setting not in _SAFE_SEARCH:
+            safe_setting = "moderate"
 
         params = {
             "client": "web",
@@ -34,7 +45,7 @@ class YepImages(YepBase):
         try:
             response = self.session.get(url)
             response.raise_for_status()
-            raw_results = response.json()
+            raw_results = json_loads(response.content)
 
             if not raw_results or len(raw_results) < 2:
                 return []
@@ -46,23 +57,24 @@ class YepImages(YepBase):
                 if result.get("type") != "Image":
                     continue
 
+                get = result.get
                 formatted_result = {
-                    "title": self._remove_html_tags(result.get("title", "")),
-                    "image": result.get("image_id", ""),
-                    "thumbnail": result.get("src", ""),
-                    "url": result.get("host_page", ""),
-                    "height": result.get("height", 0),
-                    "width": result.get("width", 0),
-                    "source": result.get("visual_url", "")
+                    "title": strip_html(get("title", "")),
+                    "image": get("image_id", ""),
+                    "thumbnail": get("src", ""),
+                    "url": get("host_page", ""),
+                    "height": get("height", 0),
+                    "width": get("width", 0),
+                    "source": get("visual_url", "")
                 }
 
                 if "srcset" in result:
-                    formatted_result["thumbnail_hd"] = result["srcset"].split(",")[1].strip().split(" ")[0]
+                    formatted_result["thumbnail_hd"] = _second_srcset_url(result["srcset"])
 
                 formatted_results.append(formatted_result)
+                if max_results and len(formatted_results) >= max_results:
+                    break
 
-            if max_results:
-                return formatted_results[:max_results]
             return formatted_results
 
         except Exception as e:
@@ -70,30 +82,3 @@ class YepImages(YepBase):
                  raise Exception(f"Yep image search failed with status {e.response.status_code}: {str(e)}")
             else:
                  raise Exception(f"Yep image search failed: {str(e)}")
-
-    def _remove_html_tags(self, text: str) -> str:
-        result = ""
-        in_tag = False
-
-        for char in text:
-            if char == '<':
-                in_tag = True
-            elif char == '>':
-                in_tag = False
-            elif not in_tag:
-                result += char
-
-        replacements = {
-            '&nbsp;': ' ',
-            '&amp;': '&',
-            '&lt;': '<',
-            '&gt;': '>',
-            '&quot;': '"',
-            '&apos;': "'",
-        }
-
-        for entity, replacement in replacements.items():
-            result = result.replace(entity, replacement)
-
-        return result.strip()
-
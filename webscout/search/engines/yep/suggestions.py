@@ -1,16 +1,34 @@
 from __future__ import annotations
 
-from typing import List
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Tuple
 from urllib.parse import urlencode
 
+from ....utils import json_loads
 from .base import YepBase
 
+# Suggestions are requested over and over for the same prefixes while a user
+# types, so recent responses are kept in a small LRU cache with a short TTL.
+_CACHE_SIZE = 256
+_CACHE_TTL = 300.0  # seconds
+_cache: OrderedDict[Tuple[str, str], Tuple[float, List[str]]] = OrderedDict()
+_cache_lock = threading.Lock()
+
 
 class YepSuggestions(YepBase):
     def run(self, *args, **kwargs) -> List[str]:
         keywords = args[0] if args else kwargs.get("keywords")
         region = args[1] if len(args) > 1 else kwargs.get("region", "all")
 
+        key = (keywords, region)
+        with _cache_lock:
+            cached = _cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL:
+                _cache.move_to_end(key)
+                return list(cached[1])
+
         params = {
             "query": keywords,
             "type": "web",
@@ -22,10 +40,18 @@ class YepSuggestions(YepBase):
         try:
             response = self.session.get(url)
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
             if isinstance(data, list) and len(data) > 1 and isinstance(data[1], list):
-                return data[1]
-            return []
+                suggestions = data[1]
+            else:
+                suggestions = []
+
+            with _cache_lock:
+                _cache[key] = (time.monotonic(), list(suggestions))
+                _cache.move_to_end(key)
+                if len(_cache) > _CACHE_SIZE:
+                    _cache.popitem(last=False)
+            return suggestions
 
         except Exception as e:
             if hasattr(e, 'response') and e.response is not None:
@@ -3,8 +3,24 @@ from __future__ import annotations
 from typing import Dict, List, Optional
 from urllib.parse import urlencode
 
+from ....utils import json_loads
+from ._html import strip_html
 from .base import YepBase
 
+_SAFE_SEARCH = frozenset(("on", "moderate", "off"))
+
+
+def _build_sitelinks(sitelinks: dict) -> Dict[str, List[Dict[str, str]]]:
+    links = [*sitelinks.get("full", ()), *sitelinks.get("short", ())]
+    if not links:
+        return {}
+    return {
+        "sitelinks": [
+            {"title": strip_html(link.get("title", "")), "href": link.get("url", "")}
+            for link in links
+        ]
+    }
+
 
 class YepSearch(YepBase):
     def run(self, *args, **kwargs) -> List[Dict[str, str]]:
@@ -13,12 +29,9 @@ class YepSearch(YepBase):
         safesearch = args[2] if len(args) > 2 else kwargs.get("safesearch", "moderate")
         max_results = args[3] if len(args) > 3 else kwargs.get("max_results")
 
-        safe_search_map = {
-            "on": "on",
-            "moderate": "moderate",
-            "off": "off"
-        }
-        safe_setting = safe_search_map.get(safesearch.lower(), "moderate")
+        safe_setting = safesearch.lower()
+        if safe_setting not in _SAFE_SEARCH:
+            safe_setting = "moderate"
 
         params = {
             "client": "web",
@@ -34,7 +47,7 @@ class YepSearch(YepBase):
         try:
             response = self.session.get(url)
             response.raise_for_status()
-            raw_results = response.json()
+            raw_results = json_loads(response.content)
 
             formatted_results = self.format_results(raw_results)
 
@@ -48,67 +61,21 @@ class YepSearch(YepBase):
                  raise Exception(f"Yep search failed: {str(e)}")
 
     def format_results(self, raw_results: dict) -> List[Dict]:
-        formatted_results = []
-
         if not raw_results or len(raw_results) < 2:
-            return formatted_results
+            return []
 
         results = raw_results[1].get('results', [])
 
-        for result in results:
-            formatted_result = {
-                "title": self._remove_html_tags(result.get("title", "")),
+        return [
+            {
+                "title": strip_html(result.get("title", "")),
                 "href": result.get("url", ""),
-                "body": self._remove_html_tags(result.get("snippet", "")),
+                "body": strip_html(result.get("snippet", "")),
                 "source": result.get("visual_url", ""),
-                "position": len(formatted_results) + 1,
+                "position": position,
                 "type": result.get("type", "organic"),
-                "first_seen": result.get("first_seen", None)
+                "first_seen": result.get("first_seen", None),
+                **(_build_sitelinks(result["sitelinks"]) if "sitelinks" in result else {}),
             }
-
-            if "sitelinks" in result:
-                sitelinks = []
-                if "full" in result["sitelinks"]:
-                    sitelinks.extend(result["sitelinks"]["full"])
-                if "short" in result["sitelinks"]:
-                    sitelinks.extend(result["sitelinks"]["short"])
-
-                if sitelinks:
-                    formatted_result["sitelinks"] = [
-                        {
-                            "title": self._remove_html_tags(link.get("title", "")),
-                            "href": link.get("url", "")
-                        }
-                        for link in sitelinks
-                    ]
-
-            formatted_results.append(formatted_result)
-
-        return formatted_results
-
-    def _remove_html_tags(self, text: str) -> str:
-        result = ""
-        in_tag = False
-
-        for char in text:
-            if char == '<':
-                in_tag = True
-            elif char == '>':
-                in_tag = False
-            elif not in_tag:
-                result += char
-
-        replacements = {
-            '&nbsp;': ' ',
-            '&amp;': '&',
-            '&lt;': '<',
-            '&gt;': '>',
-            '&quot;': '"',
-            '&apos;': "'",
-        }
-
-        for entity, replacement in replacements.items():
-            result = result.replace(entity, replacement)
-
-        return result.strip()
-
+            for position, result in enumerate(results, 1)
+        ]
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 from random import choice
-from typing import Any, Literal
+from typing import Any, Literal, Optional, Tuple
 
 try:
     import trio  # noqa: F401
@@ -17,6 +19,56 @@ from ..exceptions import RatelimitE, TimeoutE, WebscoutE
 
 logger = logging.getLogger(__name__)
 
+_SessionKey = Tuple[Optional[str], str, bool]  # (proxy, impersonate, verify)
+
+# curl_cffi sessions shared between HttpClient instances, so repeated queries
+# against the same host reuse libcurl's cached connections instead of paying
+# a new TCP + TLS handshake each time. Sessions are reference counted and
+# closed once the last client using them is closed. Pooled sessions discard
+# cookies; each HttpClient keeps its own jar so cookies never cross clients.
+_SESSION_POOL: dict[_SessionKey, curl_cffi.requests.Session] = {}
+_SESSION_REFS: dict[_SessionKey, int] = {}
+_SESSION_LOCK = threading.Lock()
+
+# Status codes search engines answer with when throttling or blocking us
+_RATE_LIMIT_CODES = frozenset({202, 301, 403, 400, 429, 418})
+
+# Browser impersonation picked once per process, so clients collapse onto
+# one pooled session per proxy instead of one per random browser
+_DEFAULT_IMPERSONATE: str | None = None
+
+
+def _acquire_session(key: _SessionKey) -> curl_cffi.requests.Session:
+    """Get the pooled session for ``key``, creating it if needed."""
+    with _SESSION_LOCK:
+        session = _SESSION_POOL.get(key)
+        if session is None:
+            proxy, impersonate, verify = key
+            session = curl_cffi.requests.Session(
+                proxies={'http': proxy, 'https': proxy} if proxy else None,
+                timeout=None,
+                impersonate=impersonate,
+                verify=verify,
+                discard_cookies=True,
+            )
+            _SESSION_POOL[key] = session
+            _SESSION_REFS[key] = 0
+        _SESSION_REFS[key] += 1
+        return session
+
+
+def _release_session(key: _SessionKey) -> None:
+    """Drop one reference to a pooled session, closing it when unused."""
+    with _SESSION_LOCK:
+        refs = _SESSION_REFS.get(key, 0) - 1
+        if refs > 0:
+            _SESSION_REFS[key] = refs
+            return
+        _SESSION_REFS.pop(key, None)
+        session = _SESSION_POOL.pop(key, None)
+    if session is not None:
+        session.close()
+
 
 class HttpClient:
     """HTTP client wrapper for search engines."""
@@ -37,6 +89,7 @@ class HttpClient:
         timeout: int | None = 10,
         verify: bool = True,
         headers: dict[str, str] | None = None,
+        impersonate: str | None = None,
     ) -> None:
         """Initialize HTTP client.
         
@@ -45,22 +98,33 @@ class HttpClient:
             timeout: Request timeout in seconds.
             verify: Whether to verify SSL certificates.
             headers: Default headers for requests.
+            impersonate: Browser to impersonate. Defaults to a random browser
+                chosen once per process.
         """
         self.proxy = proxy
         self.timeout = timeout
         self.verify = verify
+        self.headers = dict(headers) if headers else {}
+        # Cookies received by this client; the pooled session keeps none
+        self.cookies = curl_cffi.requests.Cookies()
         
-        # Choose random browser to impersonate
-        impersonate_browser = choice(self._impersonates)
+        # Choose browser to impersonate
+        impersonate_browser = impersonate or self._default_impersonate()
         
-        # Initialize curl_cffi session
-        self.client = curl_cffi.requests.Session(
-            headers=headers or {},
-            proxies={'http': self.proxy, 'https': self.proxy} if self.proxy else None,
-            timeout=timeout,
-            impersonate=impersonate_browser,
-            verify=verify,
-        )
+        # Share a pooled curl_cffi session; headers and cookies stay per client
+        self._impersonation_key: _SessionKey = (proxy, impersonate_browser, verify)
+        self._session_key: _SessionKey | None = self._impersonation_key
+        self.client = _acquire_session(self._session_key)
+        self._async_client: curl_cffi.requests.AsyncSession | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+    
+    @classmethod
+    def _default_impersonate(cls) -> str:
+        """Get the process-wide default browser impersonation."""
+        global _DEFAULT_IMPERSONATE
+        if _DEFAULT_IMPERSONATE is None:
+            _DEFAULT_IMPERSONATE = choice(cls._impersonates)
+        return _DEFAULT_IMPERSONATE
     
     def request(
         self,
@@ -95,35 +159,121 @@ class HttpClient:
             RatelimitE: Rate limit exceeded.
             WebscoutE: Other request errors.
         """
+        request_kwargs = self._build_request_kwargs(params, data, json, headers, cookies, timeout, kwargs)
         try:
-            request_kwargs: dict[str, Any] = {
-                "params": params,
-                "headers": headers,
-                "json": json,
-                "timeout": timeout or self.timeout,
-                **kwargs,
-            }
-            
-            if isinstance(cookies, dict):
-                request_kwargs["cookies"] = cookies
-            
-            if data is not None:
-                request_kwargs["data"] = data
-            
             resp = self.client.request(method, url, **request_kwargs)
-            
-            # Check response status
-            if resp.status_code == 200:
-                return resp
-            elif resp.status_code in (202, 301, 403, 400, 429, 418):
-                raise RatelimitE(f"{resp.url} {resp.status_code} Rate limit")
-            else:
-                raise WebscoutE(f"{resp.url} returned {resp.status_code}")
-                
+            self.cookies.update(resp.cookies)
+            return self._check_response(resp)
         except Exception as ex:
-            if "time" in str(ex).lower() or "timeout" in str(ex).lower():
-                raise TimeoutE(f"{url} {type(ex).__name__}: {ex}") from ex
-            raise WebscoutE(f"{url} {type(ex).__name__}: {ex}") from ex
+            raise self._wrap_error(url, ex) from ex
+    
+    async def arequest(
+        self,
+        method: Literal["GET", "POST", "HEAD", "OPTIONS", "DELETE", "PUT", "PATCH"],
+        url: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | bytes | None = None,
+        json: Any = None,
+        headers: dict[str, str] | None = None,
+        cookies: dict[str, str] | None = None,
+        timeout: int | None = None,
+        **kwargs: Any,
+    ) -> curl_cffi.requests.Response:
+        """Make HTTP request without blocking the event loop.
+        
+        Same arguments, return value and errors as :meth:`request`, but the
+        request runs on a ``curl_cffi`` ``AsyncSession`` so several requests
+        (e.g. to different search engines) can be awaited concurrently.
+        """
+        request_kwargs = self._build_request_kwargs(params, data, json, headers, cookies, timeout, kwargs)
+        await self._close_stale_async_client()
+        try:
+            resp = await self.async_client.request(method, url, **request_kwargs)
+            self.cookies.update(resp.cookies)
+            return self._check_response(resp)
+        except Exception as ex:
+            raise self._wrap_error(url, ex) from ex
+    
+    @property
+    def async_client(self) -> curl_cffi.requests.AsyncSession:
+        """Async session for :meth:`arequest`, created on first use.
+        
+        Async sessions are bound to the event loop they run on, so unlike the
+        synchronous session they are owned by a single client, not pooled, and
+        are rebuilt when the client is used from another loop (e.g. a later
+        ``asyncio.run``).
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is not None and self._async_loop is not loop:
+            # Closing needs a coroutine; :meth:`arequest` closes stale sessions
+            # before getting here, so this only drops one on direct access
+            logger.debug("Event loop changed, discarding async session")
+            self._async_client = None
+        if self._async_client is None:
+            proxy, impersonate, verify = self._impersonation_key
+            self._async_client = curl_cffi.requests.AsyncSession(
+                proxies={'http': proxy, 'https': proxy} if proxy else None,
+                timeout=None,
+                impersonate=impersonate,
+                verify=verify,
+                discard_cookies=True,
+            )
+            self._async_loop = loop
+        return self._async_client
+    
+    async def _close_stale_async_client(self) -> None:
+        """Close the async session if it was built on another event loop."""
+        if self._async_client is not None and self._async_loop is not asyncio.get_running_loop():
+            logger.debug("Event loop changed, replacing async session")
+            await self.close_async_client()
+    
+    def _build_request_kwargs(
+        self,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | bytes | None,
+        json: Any,
+        headers: dict[str, str] | None,
+        cookies: dict[str, str] | None,
+        timeout: int | None,
+        extra: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Merge per-request options with this client's defaults."""
+        request_kwargs: dict[str, Any] = {
+            "params": params,
+            "headers": {**self.headers, **headers} if headers else self.headers or None,
+            "json": json,
+            "timeout": timeout or self.timeout,
+            **extra,
+        }
+        
+        if cookies:
+            merged = curl_cffi.requests.Cookies(self.cookies)
+            merged.update(cookies)
+            request_kwargs["cookies"] = merged
+        elif self.cookies:
+            request_kwargs["cookies"] = self.cookies
+        
+        if data is not None:
+            request_kwargs["data"] = data
+        
+        return request_kwargs
+    
+    @staticmethod
+    def _check_response(resp: curl_cffi.requests.Response) -> curl_cffi.requests.Response:
+        """Return ``resp`` if it succeeded, otherwise raise."""
+        code = resp.status_code
+        if code == 200:
+            return resp
+        if code in _RATE_LIMIT_CODES:
+            raise RatelimitE("%s %d Rate limit" % (resp.url, code))
+        raise WebscoutE("%s returned %d" % (resp.url, code))
+    
+    @staticmethod
+    def _wrap_error(url: str, ex: Exception) -> WebscoutE:
+        """Convert a request failure into a webscout exception."""
+        if "time" in str(ex).lower() or "timeout" in str(ex).lower():
+            return TimeoutE(f"{url} {type(ex).__name__}: {ex}")
+        return WebscoutE(f"{url} {type(ex).__name__}: {ex}")
     
     def get(self, url: str, **kwargs: Any) -> curl_cffi.requests.Response:
         """Make GET request."""
@@ -140,12 +290,37 @@ class HttpClient:
             url: URL to set cookies for.
             cookies: Cookie dictionary.
         """
-        self.client.cookies.update(cookies)
+        self.cookies.update(cookies)
     
     def close(self) -> None:
-        """Close the HTTP client."""
-        if hasattr(self.client, 'close'):
-            self.client.close()
+        """Close the HTTP client.
+        
+        Releases this client's reference to the pooled session; the session
+        itself is closed once no other client is using it.
+        """
+        if self._session_key is not None:
+            _release_session(self._session_key)
+            self._session_key = None
+    
+    async def close_async_client(self) -> None:
+        """Close the async session, if one was opened.
+        
+        The client stays usable; a later :meth:`arequest` opens a new session.
+        """
+        session = self._async_client
+        if session is None:
+            return
+        self._async_client = None
+        self._async_loop = None
+        try:
+            await session.close()
+        except Exception as ex:
+            logger.debug("Error closing async session: %r", ex)
+    
+    async def aclose(self) -> None:
+        """Close the HTTP client, including its async session if one was opened."""
+        await self.close_async_client()
+        self.close()
     
     def __enter__(self) -> HttpClient:
         """Context manager entry."""
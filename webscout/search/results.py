@@ -2,28 +2,63 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Any
+import sys
+from collections.abc import Sequence
+from dataclasses import dataclass, field, fields
+from typing import Any, ClassVar, TypeVar
 
+# ``slots=True`` drops the per-instance ``__dict__`` (Python 3.10+ only).
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+_T = TypeVar("_T")
+
+
+def _intern_fields(self: Any) -> None:
+    """Intern the low-cardinality string fields listed in ``_INTERN_FIELDS``.
+    
+    Values like a news source or a book language repeat across thousands of
+    results; interning makes them share one string object. Free-form fields
+    (titles, bodies, URLs) are never listed.
+    """
+    for name in self._INTERN_FIELDS:
+        value = getattr(self, name)
+        if value:
+            setattr(self, name, sys.intern(value))
+
+
+def _fast_to_dict(cls: type[_T]) -> type[_T]:
+    """Give a result dataclass a ``to_dict`` generated from its fields.
+    
+    The method is compiled once per class into a single dict literal, so it
+    is as cheap as a hand-written one and never drifts from the fields. The
+    field names are also cached as ``cls._FIELD_NAMES`` for generic
+    serializers, which can read them instead of calling ``fields()``.
+    """
+    names = tuple(f.name for f in fields(cls))
+    cls._FIELD_NAMES = names  # type: ignore[attr-defined]
+    items = ", ".join(f"{name!r}: self.{name}" for name in names)
+    namespace: dict[str, Any] = {}
+    exec(f"def to_dict(self):\n    return {{{items}}}\n", namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__doc__ = "Convert to dictionary."
+    to_dict.__qualname__ = f"{cls.__qualname__}.to_dict"
+    to_dict.__module__ = cls.__module__
+    cls.to_dict = to_dict  # type: ignore[attr-defined]
+    return cls
+
+
+@_fast_to_dict
+@dataclass(**_SLOTS)
 class TextResult:
     """Text search result."""
     
     title: str = ""
     href: str = ""
     body: str = ""
-    
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "title": self.title,
-            "href": self.href,
-            "body": self.body,
-        }
 
 
-@dataclass
+@_fast_to_dict
+@dataclass(**_SLOTS)
 class ImagesResult:
     """Images search result."""
     
@@ -31,24 +66,13 @@ class ImagesResult:
     image: str = ""
     thumbnail: str = ""
     url: str = ""
+    source: str = ""
     height: int = 0
     width: int = 0
-    source: str = ""
-    
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "title": self.title,
-            "image": self.image,
-            "thumbnail": self.thumbnail,
-            "url": self.url,
-            "height": self.height,
-            "width": self.width,
-            "source": self.source,
-        }
-
-
-@dataclass
+
+
+@_fast_to_dict
+@dataclass(**_SLOTS)
 class VideosResult:
     """Videos search result."""
     
@@ -58,34 +82,24 @@ class VideosResult:
     embed_html: str = ""
     embed_url: str = ""
     image_token: str = ""
-    images: dict[str, str] = field(default_factory=dict)
     provider: str = ""
     published: str = ""
     publisher: str = ""
-    statistics: dict[str, int] = field(default_factory=dict)
     title: str = ""
     uploader: str = ""
+    url: str = ""
+    thumbnail: str = ""
+    views: str = ""
+    source: str = ""
+    images: dict[str, str] = field(default_factory=dict)
+    statistics: dict[str, int] = field(default_factory=dict)
     
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "content": self.content,
-            "description": self.description,
-            "duration": self.duration,
-            "embed_html": self.embed_html,
-            "embed_url": self.embed_url,
-            "image_token": self.image_token,
-            "images": self.images,
-            "provider": self.provider,
-            "published": self.published,
-            "publisher": self.publisher,
-            "statistics": self.statistics,
-            "title": self.title,
-            "uploader": self.uploader,
-        }
-
-
-@dataclass
+    _INTERN_FIELDS: ClassVar[frozenset[str]] = frozenset({"provider", "publisher", "source"})
+    __post_init__ = _intern_fields
+
+
+@_fast_to_dict
+@dataclass(**_SLOTS)
 class NewsResult:
     """News search result."""
     
@@ -96,19 +110,12 @@ class NewsResult:
     image: str = ""
     source: str = ""
     
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "date": self.date,
-            "title": self.title,
-            "body": self.body,
-            "url": self.url,
-            "image": self.image,
-            "source": self.source,
-        }
-
-
-@dataclass
+    _INTERN_FIELDS: ClassVar[frozenset[str]] = frozenset({"source"})
+    __post_init__ = _intern_fields
+
+
+@_fast_to_dict
+@dataclass(**_SLOTS)
 class BooksResult:
     """Books search result."""
     
@@ -122,16 +129,16 @@ class BooksResult:
     filesize: str = ""
     extension: str = ""
     
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "title": self.title,
-            "author": self.author,
-            "href": self.href,
-            "thumbnail": self.thumbnail,
-            "year": self.year,
-            "publisher": self.publisher,
-            "language": self.language,
-            "filesize": self.filesize,
-            "extension": self.extension,
-        }
+    _INTERN_FIELDS: ClassVar[frozenset[str]] = frozenset({"publisher", "language", "extension"})
+    __post_init__ = _intern_fields
+
+
+def to_dicts(results: Sequence[Any]) -> list[dict[str, Any]]:
+    """Convert a list of results of one type to dictionaries.
+    
+    Maps the class's ``to_dict`` over the list directly, skipping the
+    per-item method lookup of ``[r.to_dict() for r in results]``.
+    """
+    if not results:
+        return []
+    return list(map(type(results[0]).to_dict, results))
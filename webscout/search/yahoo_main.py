@@ -1,7 +1,7 @@
 """Yahoo unified search interface."""
 
 from __future__ import annotations
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from .base import BaseSearch
 from .engines.yahoo.text import YahooText
 from .engines.yahoo.images import YahooImages
@@ -17,38 +17,52 @@ from .engines.yahoo.weather import YahooWeather
 class YahooSearch(BaseSearch):
     """Unified Yahoo search interface."""
 
+    # Engine class per search category; instances are built on first use
+    # and reused for later queries
+    _ENGINE_CLASSES: Dict[str, type] = {
+        "text": YahooText,
+        "images": YahooImages,
+        "videos": YahooVideos,
+        "news": YahooNews,
+        "suggestions": YahooSuggestions,
+        "answers": YahooAnswers,
+        "maps": YahooMaps,
+        "translate": YahooTranslate,
+        "weather": YahooWeather,
+    }
+
+    def __init__(self) -> None:
+        self._engines: Dict[str, Any] = {}
+
+    def _engine(self, category: str) -> Any:
+        engine = self._engines.get(category)
+        if engine is None:
+            engine = self._engines[category] = self._ENGINE_CLASSES[category]()
+        return engine
+
     def text(self, keywords: str, region: str = "us", safesearch: str = "moderate", max_results: Optional[int] = None) -> List[Dict[str, str]]:
-        search = YahooText()
-        return search.run(keywords, region, safesearch, max_results)
+        return self._engine("text").run(keywords, region, safesearch, max_results)
 
     def images(self, keywords: str, region: str = "us", safesearch: str = "moderate", max_results: Optional[int] = None) -> List[Dict[str, str]]:
-        search = YahooImages()
-        return search.run(keywords, region, safesearch, max_results)
+        return self._engine("images").run(keywords, region, safesearch, max_results)
 
     def videos(self, keywords: str, region: str = "us", safesearch: str = "moderate", max_results: Optional[int] = None) -> List[Dict[str, str]]:
-        search = YahooVideos()
-        return search.run(keywords, region, safesearch, max_results)
+        return self._engine("videos").run(keywords, region, safesearch, max_results)
 
     def news(self, keywords: str, region: str = "us", safesearch: str = "moderate", max_results: Optional[int] = None) -> List[Dict[str, str]]:
-        search = YahooNews()
-        return search.run(keywords, region, safesearch, max_results)
+        return self._engine("news").run(keywords, region, safesearch, max_results)
 
     def suggestions(self, keywords: str, region: str = "us") -> List[str]:
-        search = YahooSuggestions()
-        return search.run(keywords, region)
+        return self._engine("suggestions").run(keywords, region)
 
     def answers(self, keywords: str) -> List[Dict[str, str]]:
-        search = YahooAnswers()
-        return search.run(keywords)
+        return self._engine("answers").run(keywords)
 
     def maps(self, keywords: str, place: Optional[str] = None, street: Optional[str] = None, city: Optional[str] = None, county: Optional[str] = None, state: Optional[str] = None, country: Optional[str] = None, postalcode: Optional[str] = None, latitude: Optional[str] = None, longitude: Optional[str] = None, radius: int = 0, max_results: Optional[int] = None) -> List[Dict[str, str]]:
-        search = YahooMaps()
-        return search.run(keywords, place, street, city, county, state, country, postalcode, latitude, longitude, radius, max_results)
+        return self._engine("maps").run(keywords, place, street, city, county, state, country, postalcode, latitude, longitude, radius, max_results)
 
     def translate(self, keywords: str, from_lang: Optional[str] = None, to_lang: str = "en") -> List[Dict[str, str]]:
-        search = YahooTranslate()
-        return search.run(keywords, from_lang, to_lang)
+        return self._engine("translate").run(keywords, from_lang, to_lang)
 
     def weather(self, keywords: str) -> List[Dict[str, str]]:
-        search = YahooWeather()
-        return search.run(keywords)
\ No newline at end of file
+        return self._engine("weather").run(keywords)
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Yep unified search interface."""
 
 from __future__ import annotations
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from .base import BaseSearch
 from .engines.yep.text import YepSearch as YepTextSearch
 from .engines.yep.images import YepImages
@@ -11,17 +11,31 @@ from .engines.yep.suggestions import YepSuggestions
 class YepSearch(BaseSearch):
     """Unified Yep search interface."""
 
+    # Engine class per search category; instances are built on first use
+    # and reused for later queries
+    _ENGINE_CLASSES: Dict[str, type] = {
+        "text": YepTextSearch,
+        "images": YepImages,
+        "suggestions": YepSuggestions,
+    }
+
+    def __init__(self) -> None:
+        self._engines: Dict[str, Any] = {}
+
+    def _engine(self, category: str) -> Any:
+        engine = self._engines.get(category)
+        if engine is None:
+            engine = self._engines[category] = self._ENGINE_CLASSES[category]()
+        return engine
+
     def text(self, keywords: str, region: str = "all", safesearch: str = "moderate", max_results: Optional[int] = None) -> List[Dict[str, str]]:
-        search = YepTextSearch()
-        return search.run(keywords, region, safesearch, max_results)
+        return self._engine("text").run(keywords, region, safesearch, max_results)
 
     def images(self, keywords: str, region: str = "all", safesearch: str = "moderate", max_results: Optional[int] = None) -> List[Dict[str, str]]:
-        search = YepImages()
-        return search.run(keywords, region, safesearch, max_results)
+        return self._engine("images").run(keywords, region, safesearch, max_results)
 
     def suggestions(self, keywords: str, region: str = "all") -> List[str]:
-        search = YepSuggestions()
-        return search.run(keywords, region)
+        return self._engine("suggestions").run(keywords, region)
 
     def videos(self, *args, **kwargs) -> List[Dict[str, str]]:
         """Videos search not supported by Yep."""
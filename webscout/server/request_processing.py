@@ -6,7 +6,6 @@ import json
 import time
 import uuid
 from typing import List, Dict, Any
-from datetime import datetime, timezone
 from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY, HTTP_500_INTERNAL_SERVER_ERROR
 from fastapi.responses import StreamingResponse
 
@@ -17,7 +16,7 @@ import sys
 from .request_models import Message, ChatCompletionRequest
 from .exceptions import APIError, clean_text
 
-from .simple_logger import log_api_request, get_client_ip, generate_request_id
+from .simple_logger import log_api_request_sync, get_client_ip, generate_request_id
 from .config import AppConfig
 
 # Setup logger
@@ -40,7 +39,8 @@ async def log_request(request_id: str, ip_address: str, model_used: str, questio
             if request_obj:
                 user_agent = request_obj.headers.get("user-agent")
             
-            await log_api_request(
+            # The console logger does no I/O worth awaiting, so skip the coroutine
+            log_api_request_sync(
                 request_id=request_id,
                 ip_address=ip_address,
                 model=model_used,
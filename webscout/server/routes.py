@@ -6,11 +6,10 @@ import time
 import uuid
 import secrets
 import sys
-from datetime import datetime, timezone
 from typing import Any
 
 from fastapi import FastAPI, Request, Body, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.status import (
@@ -38,7 +37,7 @@ from .request_processing import (
     process_messages, prepare_provider_params,
     handle_streaming_response, handle_non_streaming_response
 )
-from .simple_logger import request_logger
+from .simple_logger import request_logger, utc_timestamp
 from ..search import DuckDuckGoSearch, YepSearch
 from ..search import BingSearch
 
@@ -387,6 +386,8 @@ class Api:
 
         @self.app.get(
             "/search",
+            # Result lists are plain strings and ints; encode them with orjson
+            response_class=ORJSONResponse,
             tags=["Web search"],
             description="Unified web search endpoint supporting Yep, DuckDuckGo, and Bing with text, news, images, and suggestions search types."
         )
@@ -491,17 +492,19 @@ class Api:
         )
         async def enhanced_health_check():
             """Enhanced health check."""
+            # Polled by load balancers; serialize the plain dict directly
+            # instead of going through FastAPI's jsonable_encoder
             try:
-                return {
+                return ORJSONResponse({
                     "status": "healthy",
                     "auth_required": AppConfig.auth_required,
                     "rate_limit_enabled": AppConfig.rate_limit_enabled,
                     "request_logging_enabled": AppConfig.request_logging_enabled,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                }
+                    "timestamp": utc_timestamp()
+                })
             except Exception as e:
-                return {
+                return ORJSONResponse({
                     "status": "unhealthy",
                     "error": str(e),
-                    "timestamp": datetime.now(timezone.utc).isoformat()
-                }
+                    "timestamp": utc_timestamp()
+                })
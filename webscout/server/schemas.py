@@ -2,11 +2,13 @@
 
 from datetime import datetime
 from typing import Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class ErrorResponse(BaseModel):
     """Standard error response model."""
+    model_config = ConfigDict(frozen=True)
+
     error: str = Field(..., description="Error message")
     code: str = Field(..., description="Error code")
     details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
@@ -14,10 +16,11 @@ class ErrorResponse(BaseModel):
 
 class HealthCheckResponse(BaseModel):
     """Health check response model."""
+    model_config = ConfigDict(frozen=True)
+
     status: str = Field(..., description="Service status")
     timestamp: datetime = Field(..., description="Check timestamp")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
\ No newline at end of file
+    @field_serializer("timestamp")
+    def _serialize_timestamp(self, value: datetime) -> str:
+        return value.isoformat()
@@ -8,18 +8,20 @@ authentication, and provider management.
 
 from __future__ import annotations
 
+import hashlib
 import os
 import sys
 import time
 from datetime import datetime, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import Final, Optional
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 from fastapi.openapi.docs import get_swagger_ui_html
-from starlette.responses import HTMLResponse
+from starlette.responses import Response
 
 from webscout.Litlogger import Logger, LogLevel, LogFormat, ConsoleHandler
 from .config import ServerConfig, AppConfig
@@ -40,6 +42,54 @@ logger = Logger(
     fmt=LogFormat.DEFAULT
 )
 
+# Simple, clean footer with WebScout branding
+_FOOTER_HTML: Final[str] = """
+<div style='
+    position: fixed;
+    bottom: 0;
+    left: 0;
+    right: 0;
+    background: rgba(255, 255, 255, 0.95);
+    backdrop-filter: blur(10px);
+    border-top: 1px solid #e5e7eb;
+    padding: 12px 20px;
+    text-align: center;
+    font-size: 14px;
+    color: #6b7280;
+    z-index: 1000;
+    box-shadow: 0 -2px 10px rgba(0, 0, 0, 0.1);
+'>
+    Powered by <a href='https://github.com/OEvortex/Webscout' target='_blank' style='
+        color: #6366f1;
+        text-decoration: none;
+        font-weight: 600;
+        transition: color 0.2s ease;
+    ' onmouseover='this.style.color="#4f46e5"' onmouseout='this.style.color="#6366f1"'>
+        WebScout
+    </a>
+</div>
+<style>
+    body {
+        padding-bottom: 60px !important;
+    }
+    .swagger-ui .topbar {
+        background-color: #fafafa;
+        border-bottom: 1px solid #e5e7eb;
+    }
+    .swagger-ui .info .title {
+        color: #1f2937;
+    }
+    .swagger-ui .btn.authorize {
+        background-color: #6366f1;
+        border-color: #6366f1;
+    }
+    .swagger-ui .btn.authorize:hover {
+        background-color: #4f46e5;
+        border-color: #4f46e5;
+    }
+</style>
+"""
+
 # Global configuration instance - lazy initialization
 config = None
 
@@ -53,13 +103,13 @@ def get_config() -> ServerConfig:
 
 def create_app():
     """Create and configure the FastAPI application."""
-    import os
-    app_title = os.getenv("WEBSCOUT_API_TITLE", "Webscout API")
-    app_description = os.getenv("WEBSCOUT_API_DESCRIPTION", "OpenAI API compatible interface for various LLM providers")
-    app_version = os.getenv("WEBSCOUT_API_VERSION", "0.2.0")
-    app_docs_url = os.getenv("WEBSCOUT_API_DOCS_URL", "/docs")
-    app_redoc_url = os.getenv("WEBSCOUT_API_REDOC_URL", "/redoc")
-    app_openapi_url = os.getenv("WEBSCOUT_API_OPENAPI_URL", "/openapi.json")
+    _get = os.environ.get
+    app_title = _get("WEBSCOUT_API_TITLE", "Webscout API")
+    app_description = _get("WEBSCOUT_API_DESCRIPTION", "OpenAI API compatible interface for various LLM providers")
+    app_version = _get("WEBSCOUT_API_VERSION", "0.2.0")
+    app_docs_url = _get("WEBSCOUT_API_DOCS_URL", "/docs")
+    app_redoc_url = _get("WEBSCOUT_API_REDOC_URL", "/redoc")
+    app_openapi_url = _get("WEBSCOUT_API_OPENAPI_URL", "/openapi.json")
 
     app = FastAPI(
         title=app_title,
@@ -71,63 +121,20 @@ def create_app():
     )
 
     # Simple Custom Swagger UI with WebScout footer
+    # The page is static, so build it once and serve the cached bytes
+    html = get_swagger_ui_html(
+        openapi_url=app.openapi_url,
+        title=app.title + " - API Documentation",
+    ).body.decode("utf-8")
+    
+    docs_html = html.replace("</body>", f"{_FOOTER_HTML}</body>").encode("utf-8")
+    docs_etag = f'"{hashlib.sha1(docs_html).hexdigest()}"'
+
     @app.get(app_docs_url, include_in_schema=False)
-    async def custom_swagger_ui_html():
-        html = get_swagger_ui_html(
-            openapi_url=app.openapi_url,
-            title=app.title + " - API Documentation",
-        ).body.decode("utf-8")
-        
-        # Simple, clean footer with WebScout branding
-        footer_html = """
-        <div style='
-            position: fixed;
-            bottom: 0;
-            left: 0;
-            right: 0;
-            background: rgba(255, 255, 255, 0.95);
-            backdrop-filter: blur(10px);
-            border-top: 1px solid #e5e7eb;
-            padding: 12px 20px;
-            text-align: center;
-            font-size: 14px;
-            color: #6b7280;
-            z-index: 1000;
-            box-shadow: 0 -2px 10px rgba(0, 0, 0, 0.1);
-        '>
-            Powered by <a href='https://github.com/OEvortex/Webscout' target='_blank' style='
-                color: #6366f1;
-                text-decoration: none;
-                font-weight: 600;
-                transition: color 0.2s ease;
-            ' onmouseover='this.style.color="#4f46e5"' onmouseout='this.style.color="#6366f1"'>
-                WebScout
-            </a>
-        </div>
-        <style>
-            body {
-                padding-bottom: 60px !important;
-            }
-            .swagger-ui .topbar {
-                background-color: #fafafa;
-                border-bottom: 1px solid #e5e7eb;
-            }
-            .swagger-ui .info .title {
-                color: #1f2937;
-            }
-            .swagger-ui .btn.authorize {
-                background-color: #6366f1;
-                border-color: #6366f1;
-            }
-            .swagger-ui .btn.authorize:hover {
-                background-color: #4f46e5;
-                border-color: #4f46e5;
-            }
-        </style>
-        """
-        
-        html = html.replace("</body>", f"{footer_html}</body>")
-        return HTMLResponse(content=html)
+    async def custom_swagger_ui_html(request: Request):
+        if request.headers.get("if-none-match") == docs_etag:
+            return Response(status_code=304, headers={"ETag": docs_etag})
+        return Response(content=docs_html, media_type="text/html", headers={"ETag": docs_etag})
 
     # Add CORS middleware
     app.add_middleware(
@@ -188,6 +195,46 @@ def start_server(
     )
 
 
+@lru_cache(maxsize=4)
+def _format_provider_banner(provider_items: frozenset, tti_provider_items: frozenset) -> str:
+    """Build the provider/model listing printed by ``run_api``.
+
+    Cached on the provider map contents, so repeated starts with the same
+    registered providers reuse the formatted text.
+    """
+    provider_map = dict(provider_items)
+    tti_provider_map = dict(tti_provider_items)
+    lines = []
+
+    provider_class_names = {v.__name__ for v in provider_map.values()}
+    lines.append(f"\n--- Available Providers ({len(provider_class_names)}) ---")
+    for i, provider_name in enumerate(sorted(provider_class_names), 1):
+        lines.append(f"{i}. {provider_name}")
+
+    models = sorted(model for model in provider_map if model not in provider_class_names)
+    if models:
+        lines.append(f"\n--- Available Models ({len(models)}) ---")
+        for i, model_name in enumerate(models, 1):
+            lines.append(f"{i}. {model_name} (via {provider_map[model_name].__name__})")
+    else:
+        lines.append("\nNo specific models registered. Use provider names as models.")
+
+    tti_provider_names = {v.__name__ for v in tti_provider_map.values()}
+    lines.append(f"\n--- Available TTI Providers ({len(tti_provider_names)}) ---")
+    for i, provider_name in enumerate(sorted(tti_provider_names), 1):
+        lines.append(f"{i}. {provider_name}")
+
+    tti_models = sorted(model for model in tti_provider_map if model not in tti_provider_names)
+    if tti_models:
+        lines.append(f"\n--- Available TTI Models ({len(tti_models)}) ---")
+        for i, model_name in enumerate(tti_models, 1):
+            lines.append(f"{i}. {model_name} (via {tti_provider_map[model_name].__name__})")
+    else:
+        lines.append("\nNo specific TTI models registered. Use TTI provider names as models.")
+
+    return "\n".join(lines)
+
+
 def run_api(
     host: str = '0.0.0.0',
     port: int = None,
@@ -239,32 +286,10 @@ def run_api(
         print(f"Log Level: {log_level}")
         print(f"Debug Mode: {'Enabled' if debug else 'Disabled'}")
 
-        providers = list(set(v.__name__ for v in AppConfig.provider_map.values()))
-        print(f"\n--- Available Providers ({len(providers)}) ---")
-        for i, provider_name in enumerate(sorted(providers), 1):
-            print(f"{i}. {provider_name}")
-
-        provider_class_names = set(v.__name__ for v in AppConfig.provider_map.values())
-        models = sorted([model for model in AppConfig.provider_map.keys() if model not in provider_class_names])
-        if models:
-            print(f"\n--- Available Models ({len(models)}) ---")
-            for i, model_name in enumerate(models, 1):
-                print(f"{i}. {model_name} (via {AppConfig.provider_map[model_name].__name__})")
-        else:
-            print("\nNo specific models registered. Use provider names as models.")
-
-        tti_providers = list(set(v.__name__ for v in AppConfig.tti_provider_map.values()))
-        print(f"\n--- Available TTI Providers ({len(tti_providers)}) ---")
-        for i, provider_name in enumerate(sorted(tti_providers), 1):
-            print(f"{i}. {provider_name}")
-
-        tti_models = sorted([model for model in AppConfig.tti_provider_map.keys() if model not in tti_providers])
-        if tti_models:
-            print(f"\n--- Available TTI Models ({len(tti_models)}) ---")
-            for i, model_name in enumerate(tti_models, 1):
-                print(f"{i}. {model_name} (via {AppConfig.tti_provider_map[model_name].__name__})")
-        else:
-            print("\nNo specific TTI models registered. Use TTI provider names as models.")
+        print(_format_provider_banner(
+            frozenset(AppConfig.provider_map.items()),
+            frozenset(AppConfig.tti_provider_map.items()),
+        ))
 
         print("\nUse Ctrl+C to stop the server.")
         print("=" * 40 + "\n")
@@ -296,13 +321,14 @@ def main():
     import argparse
 
     # Read environment variables with fallbacks
-    default_port = int(os.getenv('WEBSCOUT_PORT', os.getenv('PORT', DEFAULT_PORT)))
-    default_host = os.getenv('WEBSCOUT_HOST', DEFAULT_HOST)
-    default_workers = int(os.getenv('WEBSCOUT_WORKERS', '1'))
-    default_log_level = os.getenv('WEBSCOUT_LOG_LEVEL', 'info')
-    default_provider = os.getenv('WEBSCOUT_DEFAULT_PROVIDER', os.getenv('DEFAULT_PROVIDER'))
-    default_base_url = os.getenv('WEBSCOUT_BASE_URL', os.getenv('BASE_URL'))
-    default_debug = os.getenv('WEBSCOUT_DEBUG', os.getenv('DEBUG', 'false')).lower() == 'true'
+    _get = os.environ.get
+    default_port = int(_get('WEBSCOUT_PORT', _get('PORT', DEFAULT_PORT)))
+    default_host = _get('WEBSCOUT_HOST', DEFAULT_HOST)
+    default_workers = int(_get('WEBSCOUT_WORKERS', '1'))
+    default_log_level = _get('WEBSCOUT_LOG_LEVEL', 'info')
+    default_provider = _get('WEBSCOUT_DEFAULT_PROVIDER', _get('DEFAULT_PROVIDER'))
+    default_base_url = _get('WEBSCOUT_BASE_URL', _get('BASE_URL'))
+    default_debug = _get('WEBSCOUT_DEBUG', _get('DEBUG', 'false')).lower() == 'true'
 
     parser = argparse.ArgumentParser(description='Start Webscout OpenAI-compatible API server')
     parser.add_argument('--port', type=int, default=default_port, help=f'Port to run the server on (default: {default_port})')
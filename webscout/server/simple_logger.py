@@ -3,7 +3,8 @@ Simple logger for no-auth mode.
 """
 
 import asyncio
-from datetime import datetime, timezone
+import secrets
+import time
 from typing import Optional, Dict, Any
 import sys
 from webscout.Litlogger import Logger, LogLevel, LogFormat, ConsoleHandler
@@ -19,10 +20,13 @@ logger = Logger(
 class SimpleRequestLogger:
     """Simple request logger for no-auth mode."""
 
+    # Stateless; declare per-instance fields here if any are added
+    __slots__ = ()
+
     def __init__(self):
         logger.info("Simple request logger initialized (no database).")
 
-    async def log_request(
+    def log_request_sync(
         self,
         request_id: str,
         ip_address: str,
@@ -31,10 +35,22 @@ class SimpleRequestLogger:
         answer: str,
         **kwargs
     ) -> bool:
-        """Logs request details to the console."""
+        """Logs request details to the console without a coroutine round-trip."""
         logger.info(f"Request {request_id}: model={model}, ip={ip_address}")
         return True
 
+    async def log_request(
+        self,
+        request_id: str,
+        ip_address: str,
+        model: str,
+        question: str,
+        answer: str,
+        **kwargs
+    ) -> bool:
+        """Logs request details to the console."""
+        return self.log_request_sync(request_id, ip_address, model, question, answer, **kwargs)
+
     async def get_recent_requests(self, limit: int = 10) -> Dict[str, Any]:
         """Returns empty list of recent requests."""
         logger.info("get_recent_requests called, but no database is configured.")
@@ -66,19 +82,42 @@ async def log_api_request(
         **kwargs
     )
 
+def log_api_request_sync(
+    request_id: str,
+    ip_address: str,
+    model: str,
+    question: str,
+    answer: str,
+    **kwargs
+) -> bool:
+    """Synchronous variant of :func:`log_api_request` for the console logger."""
+    return request_logger.log_request_sync(
+        request_id=request_id,
+        ip_address=ip_address,
+        model=model,
+        question=question,
+        answer=answer,
+        **kwargs
+    )
+
 def get_client_ip(request) -> str:
     """Extract client IP address from request."""
-    forwarded_for = request.headers.get("X-Forwarded-For")
+    headers = request.headers
+    forwarded_for = headers.get("X-Forwarded-For")
     if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
-    
-    real_ip = request.headers.get("X-Real-IP")
+        # Only the first (client) hop is needed; partition avoids a list
+        return forwarded_for.partition(",")[0].strip()
+
+    real_ip = headers.get("X-Real-IP")
     if real_ip:
         return real_ip.strip()
-    
+
     return getattr(request.client, "host", "unknown")
 
 def generate_request_id() -> str:
     """Generate a unique request ID."""
-    import uuid
-    return str(uuid.uuid4())
\ No newline at end of file
+    return secrets.token_hex(16)
+
+def utc_timestamp(epoch: Optional[float] = None) -> str:
+    """Format ``epoch`` (default: now) as an ISO 8601 UTC timestamp to the second."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(epoch))
@@ -1,2 +1,4 @@
-__version__ = "2025.11.7"
-__prog__ = "webscout"
+from typing import Final
+
+__version__: Final[str] = "2025.11.7"
+__prog__: Final[str] = "webscout"
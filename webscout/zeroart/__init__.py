@@ -4,13 +4,53 @@ ZeroArt: A zero-dependency ASCII art text generator
 Create awesome ASCII art text without external dependencies!
 """
 
-from typing import Dict, List, Literal, Optional, Union
+from typing import Callable, Dict, Iterator, List, Literal, Optional, Type, Union
 from .base import ZeroArtFont
 from .fonts import BlockFont, SlantFont, NeonFont, CyberFont, DottedFont, ShadowFont, ThreeDFont, ElectronicFont, IsometricFont
 from .effects import AsciiArtEffects
 
 FontType = Literal['block', 'slant', 'neon', 'cyber', 'dotted', 'shadow', '3d', 'electronic', 'isometric']
 
+_FONT_CLASSES: Dict[str, Type[ZeroArtFont]] = {
+    'block': BlockFont,
+    'slant': SlantFont,
+    'neon': NeonFont,
+    'cyber': CyberFont,
+    'dotted': DottedFont,
+    'shadow': ShadowFont,
+    '3d': ThreeDFont,
+    'electronic': ElectronicFont,
+    'isometric': IsometricFont
+}
+
+# Shared font instances, built on first use
+_FONT_REGISTRY: Dict[str, ZeroArtFont] = {}
+
+def _get_font(name: str) -> ZeroArtFont:
+    """
+    Get the shared font instance for a font name
+    
+    :param name: Lowercase font name (unknown names fall back to 'block')
+    :return: Font instance, built once per font
+    """
+    if name not in _FONT_CLASSES:
+        name = 'block'
+    font = _FONT_REGISTRY.get(name)
+    if font is None:
+        font = _FONT_REGISTRY[name] = _FONT_CLASSES[name]()
+    return font
+
+def _resolve_font(font: Union[str, ZeroArtFont]) -> ZeroArtFont:
+    """
+    Resolve a font name or instance to a font instance
+    
+    :param font: Font style name or font instance
+    :return: Font instance ('block' for unknown names)
+    """
+    if isinstance(font, str):
+        return _get_font(font.lower())
+    return font
+
 def figlet_format(text: str, font: Union[str, ZeroArtFont] = 'block') -> str:
     """
     Generate ASCII art text
@@ -19,23 +59,17 @@ def figlet_format(text: str, font: Union[str, ZeroArtFont] = 'block') -> str:
     :param font: Font style (default: 'block')
     :return: ASCII art representation of text
     """
-    font_map: Dict[str, ZeroArtFont] = {
-        'block': BlockFont(),
-        'slant': SlantFont(),
-        'neon': NeonFont(),
-        'cyber': CyberFont(),
-        'dotted': DottedFont(),
-        'shadow': ShadowFont(),
-        '3d': ThreeDFont(),
-        'electronic': ElectronicFont(),
-        'isometric': IsometricFont()
-    }
+    return _resolve_font(font).render(text)
+
+def figlet_iter(text: str, font: Union[str, ZeroArtFont] = 'block') -> Iterator[str]:
+    """
+    Generate ASCII art text one line at a time
     
-    if isinstance(font, str):
-        selected_font: ZeroArtFont = font_map.get(font.lower(), BlockFont())
-    else:
-        selected_font = font
-    return selected_font.render(text)
+    :param text: Text to convert
+    :param font: Font style (default: 'block')
+    :return: Iterator over the lines of the ASCII art
+    """
+    return _resolve_font(font).render_lines(text)
 
 def print_figlet(text: str, font: Union[str, ZeroArtFont] = 'block') -> None:
     """
@@ -44,7 +78,8 @@ def print_figlet(text: str, font: Union[str, ZeroArtFont] = 'block') -> None:
     :param text: Text to convert and print
     :param font: Font style (default: 'block')
     """
-    print(figlet_format(text, font))
+    for line in figlet_iter(text, font):
+        print(line)
 
 # Expose additional effects with font handling
 def rainbow(text: str, font: Union[str, ZeroArtFont] = 'block') -> str:
@@ -55,23 +90,16 @@ def rainbow(text: str, font: Union[str, ZeroArtFont] = 'block') -> str:
     :param font: Font style (default: 'block')
     :return: Rainbow-styled ASCII art
     """
-    font_map: Dict[str, ZeroArtFont] = {
-        'block': BlockFont(),
-        'slant': SlantFont(),
-        'neon': NeonFont(),
-        'cyber': CyberFont(),
-        'dotted': DottedFont(),
-        'shadow': ShadowFont(),
-        '3d': ThreeDFont(),
-        'electronic': ElectronicFont(),
-        'isometric': IsometricFont()
-    }
+    return AsciiArtEffects.rainbow_effect(text, _resolve_font(font))
+
+def compile_rainbow(font: Union[str, ZeroArtFont] = 'block') -> Callable[[str], str]:
+    """
+    Build a rainbow effect renderer with the font resolved once
     
-    if isinstance(font, str):
-        selected_font: ZeroArtFont = font_map.get(font.lower(), BlockFont())
-    else:
-        selected_font = font
-    return AsciiArtEffects.rainbow_effect(text, selected_font)
+    :param font: Font style (default: 'block')
+    :return: Function mapping text to rainbow-styled ASCII art
+    """
+    return AsciiArtEffects.compile_rainbow(_resolve_font(font))
 
 def glitch(text: str, font: Union[str, ZeroArtFont] = 'block', glitch_intensity: float = 0.1) -> str:
     """
@@ -82,23 +110,7 @@ def glitch(text: str, font: Union[str, ZeroArtFont] = 'block', glitch_intensity:
     :param glitch_intensity: Probability of character distortion
     :return: Glitched ASCII art
     """
-    font_map: Dict[str, ZeroArtFont] = {
-        'block': BlockFont(),
-        'slant': SlantFont(),
-        'neon': NeonFont(),
-        'cyber': CyberFont(),
-        'dotted': DottedFont(),
-        'shadow': ShadowFont(),
-        '3d': ThreeDFont(),
-        'electronic': ElectronicFont(),
-        'isometric': IsometricFont()
-    }
-    
-    if isinstance(font, str):
-        selected_font: ZeroArtFont = font_map.get(font.lower(), BlockFont())
-    else:
-        selected_font = font
-    return AsciiArtEffects.glitch_effect(text, selected_font, glitch_intensity)
+    return AsciiArtEffects.glitch_effect(text, _resolve_font(font), glitch_intensity)
 
 wrap_text = AsciiArtEffects.wrap_text
 
@@ -111,23 +123,7 @@ def outline(text: str, font: Union[str, ZeroArtFont] = 'block', outline_char: st
     :param outline_char: Character to use for outline
     :return: ASCII art with outline
     """
-    font_map: Dict[str, ZeroArtFont] = {
-        'block': BlockFont(),
-        'slant': SlantFont(),
-        'neon': NeonFont(),
-        'cyber': CyberFont(),
-        'dotted': DottedFont(),
-        'shadow': ShadowFont(),
-        '3d': ThreeDFont(),
-        'electronic': ElectronicFont(),
-        'isometric': IsometricFont()
-    }
-    
-    if isinstance(font, str):
-        selected_font: ZeroArtFont = font_map.get(font.lower(), BlockFont())
-    else:
-        selected_font = font
-    return AsciiArtEffects.outline_effect(text, selected_font, outline_char)
+    return AsciiArtEffects.outline_effect(text, _resolve_font(font), outline_char)
 
 def gradient(text: str, font: Union[str, ZeroArtFont] = 'block', color1: tuple = (255, 0, 0), color2: tuple = (0, 0, 255)) -> str:
     """
@@ -139,23 +135,7 @@ def gradient(text: str, font: Union[str, ZeroArtFont] = 'block', color1: tuple =
     :param color2: Ending RGB color
     :return: Gradient-styled ASCII art
     """
-    font_map: Dict[str, ZeroArtFont] = {
-        'block': BlockFont(),
-        'slant': SlantFont(),
-        'neon': NeonFont(),
-        'cyber': CyberFont(),
-        'dotted': DottedFont(),
-        'shadow': ShadowFont(),
-        '3d': ThreeDFont(),
-        'electronic': ElectronicFont(),
-        'isometric': IsometricFont()
-    }
-    
-    if isinstance(font, str):
-        selected_font: ZeroArtFont = font_map.get(font.lower(), BlockFont())
-    else:
-        selected_font = font
-    return AsciiArtEffects.gradient_effect(text, selected_font, color1, color2)
+    return AsciiArtEffects.gradient_effect(text, _resolve_font(font), color1, color2)
 
 def bounce(text: str, font: Union[str, ZeroArtFont] = 'block', bounce_height: int = 2) -> str:
     """
@@ -166,28 +146,14 @@ def bounce(text: str, font: Union[str, ZeroArtFont] = 'block', bounce_height: in
     :param bounce_height: Height of the bounce
     :return: Bouncing ASCII art
     """
-    font_map: Dict[str, ZeroArtFont] = {
-        'block': BlockFont(),
-        'slant': SlantFont(),
-        'neon': NeonFont(),
-        'cyber': CyberFont(),
-        'dotted': DottedFont(),
-        'shadow': ShadowFont(),
-        '3d': ThreeDFont(),
-        'electronic': ElectronicFont(),
-        'isometric': IsometricFont()
-    }
-    
-    if isinstance(font, str):
-        selected_font: ZeroArtFont = font_map.get(font.lower(), BlockFont())
-    else:
-        selected_font = font
-    return AsciiArtEffects.bouncing_effect(text, selected_font, bounce_height)
+    return AsciiArtEffects.bouncing_effect(text, _resolve_font(font), bounce_height)
 
 __all__ = [
     'figlet_format', 
+    'figlet_iter',
     'print_figlet', 
     'rainbow', 
+    'compile_rainbow',
     'glitch', 
     'wrap_text', 
     'outline',
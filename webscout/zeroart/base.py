@@ -1,7 +1,7 @@
 """
 ZeroArt Base: Core classes and utilities for ASCII art generation
 """
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 class ZeroArtFont:
     """Base class for ASCII art fonts"""
@@ -9,6 +9,8 @@ class ZeroArtFont:
         self.name: str = name
         self.letters: Dict[str, List[str]] = {}
         self.special_chars: Dict[str, List[str]] = {}
+        # Rendered art per text, used by the effects; cleared when glyphs change
+        self._render_cache: Dict[str, Tuple[str, Tuple[str, ...], int]] = {}
 
     def add_letter(self, char: str, art_lines: List[str]) -> None:
         """
@@ -18,6 +20,7 @@ class ZeroArtFont:
         :param art_lines: List of art lines representing the character
         """
         self.letters[char.upper()] = art_lines
+        self._render_cache.clear()
 
     def add_special_char(self, name: str, art_lines: List[str]) -> None:
         """
@@ -27,6 +30,7 @@ class ZeroArtFont:
         :param art_lines: List of art lines representing the character
         """
         self.special_chars[name] = art_lines
+        self._render_cache.clear()
 
     def get_letter(self, char: str) -> List[str]:
         """
@@ -37,30 +41,33 @@ class ZeroArtFont:
         """
         return self.letters.get(char.upper(), self.letters.get(' ', [' ']))
 
-    def render(self, text: str) -> str:
+    def render_lines(self, text: str) -> Iterator[str]:
         """
-        Render text as ASCII art
+        Render text as ASCII art, one line at a time
         
         :param text: Text to render as ASCII art
-        :return: ASCII art representation of the text
+        :return: Iterator over the lines of the ASCII art
         """
         if not text:
-            return ""
-              # Get the maximum height of any character in the font
-        max_height: int = max(len(self.get_letter(c)) for c in text)
-        
-        # Initialize art_lines with empty strings
-        art_lines: List[str] = ["" for _ in range(max_height)]
+            return
+        glyphs: List[List[str]] = [self.get_letter(c) for c in text]
+        # Get the maximum height of any character in the font
+        max_height: int = max(map(len, glyphs))
         
-        # Process each character
-        for char in text:
-            char_art: List[str] = self.get_letter(char)
-            # Pad shorter characters with empty lines to match max_height
+        # Pad shorter characters with empty lines to match max_height
+        for char_art in glyphs:
             while len(char_art) < max_height:
                 char_art.append(" " * len(char_art[0]))
-                
-            # Add character art to each line
-            for i in range(max_height):
-                art_lines[i] += char_art[i] + " "
-                
-        return "\n".join(art_lines)
+        
+        # Build each line from the matching row of every character
+        for i in range(max_height):
+            yield "".join([char_art[i] + " " for char_art in glyphs])
+
+    def render(self, text: str) -> str:
+        """
+        Render text as ASCII art
+        
+        :param text: Text to render as ASCII art
+        :return: ASCII art representation of the text
+        """
+        return "\n".join(self.render_lines(text))
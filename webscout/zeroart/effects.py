@@ -2,10 +2,121 @@
 ZeroArt Effects: ASCII art text effects and transformations
 """
 
+import math
 import random
 import textwrap
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple, Union
 from .base import ZeroArtFont
+
+# ANSI reset sequence ending every coloured line
+_RESET = '\033[0m'
+# ANSI 24-bit foreground colour escape
+_RGB_FMT = '\033[38;2;%d;%d;%dm'
+
+# ANSI colours cycled by the rainbow effect
+_RAINBOW_COLORS: Tuple[str, ...] = (
+    '\033[91m',  # Red
+    '\033[93m',  # Yellow
+    '\033[92m',  # Green
+    '\033[94m',  # Blue
+    '\033[95m',  # Magenta
+)
+
+@lru_cache(maxsize=64)
+def _gradient_prefixes(color1: tuple, color2: tuple, num_lines: int) -> Tuple[str, ...]:
+    """
+    Compute the ANSI colour escape for each line of a gradient
+    
+    Fonts have a fixed height, so the same (colours, height) combination
+    recurs on every call and the interpolation only runs once for it.
+    
+    :param color1: Starting RGB color
+    :param color2: Ending RGB color
+    :param num_lines: Number of lines in the art
+    :return: One escape sequence per line
+    """
+    r1, g1, b1 = color1
+    r2, g2, b2 = color2
+    denom = max(1, num_lines - 1)
+    prefixes: List[str] = []
+    for i in range(num_lines):
+        # Calculate interpolated color
+        ratio = i / denom
+        inv = 1 - ratio
+        prefixes.append(_RGB_FMT % (
+            int(r1 * inv + r2 * ratio),
+            int(g1 * inv + g2 * ratio),
+            int(b1 * inv + b2 * ratio),
+        ))
+    return tuple(prefixes)
+
+def _glitch_sparse(art: str, glitch_chars: List[str], glitch_intensity: float) -> str:
+    """
+    Replace each character of art with probability glitch_intensity
+    
+    Instead of rolling once per character, draws the gap to the next glitched
+    character from the matching geometric distribution, so the number of RNG
+    calls scales with the number of glitches rather than the size of the art.
+    
+    :param art: Rendered ASCII art
+    :param glitch_chars: Replacement characters
+    :param glitch_intensity: Probability of character distortion, in (0, 1)
+    :return: Glitched ASCII art
+    """
+    log_keep = math.log1p(-glitch_intensity)
+    if log_keep == 0.0:
+        # Intensity too small to ever glitch a character
+        return art
+    chars: List[str] = list(art)
+    size = len(chars)
+    rand = random.random
+    choice = random.choice
+    log = math.log
+    # Gaps are compared as floats first; they can exceed any int for tiny intensities
+    gap = log(1.0 - rand()) / log_keep
+    i = 0
+    while gap < size - i:
+        i += int(gap)
+        if chars[i] != '\n':
+            chars[i] = choice(glitch_chars)
+        i += 1
+        gap = log(1.0 - rand()) / log_keep
+    return ''.join(chars)
+
+# Distinct texts remembered per font before its render cache is reset
+_RENDER_CACHE_SIZE = 256
+
+def _measure(art: str) -> Tuple[str, Tuple[str, ...], int]:
+    """
+    Split rendered art into lines and measure its widest line
+    
+    :param art: Rendered ASCII art
+    :return: The art, its lines and the width of its widest line
+    """
+    lines = tuple(art.splitlines())
+    return art, lines, max(map(len, lines), default=0)
+
+def _render_cached(font: ZeroArtFont, text: str) -> Tuple[str, Tuple[str, ...], int]:
+    """
+    Render text with a font, reusing earlier renders of the same text
+    
+    The split lines and maximum width are cached with the art, so effects
+    applied to the same text do not re-split or re-measure it.
+    
+    :param font: Font to use
+    :param text: Text to render
+    :return: The art, its lines and the width of its widest line
+    """
+    cache = getattr(font, '_render_cache', None)
+    if cache is None:
+        return _measure(font.render(text))
+    rendered = cache.get(text)
+    if rendered is None:
+        if len(cache) >= _RENDER_CACHE_SIZE:
+            cache.clear()
+        rendered = cache[text] = _measure(font.render(text))
+    return rendered
  
 class AsciiArtEffects:
     """Collection of ASCII art text effects"""
@@ -19,26 +130,41 @@ class AsciiArtEffects:
         :param font: Font to use
         :return: Rainbow-styled ASCII art
         """
-        colors: List[str] = [
-            '\033[91m',  # Red
-            '\033[93m',  # Yellow
-            '\033[92m',  # Green
-            '\033[94m',  # Blue
-            '\033[95m',  # Magenta
-        ]
+        return AsciiArtEffects.compile_rainbow(font)(text)
+    
+    @staticmethod
+    def compile_rainbow(font: ZeroArtFont) -> Callable[[str], str]:
+        """
+        Build a rainbow effect renderer bound to one font
         
-        art: str = font.render(text)
-        art_lines: List[str] = art.split('\n')
+        The font, colours and helpers are bound once in the returned function,
+        which suits callers applying the effect to many texts, such as
+        animation frames.
         
-        colored_lines: List[str] = []
-        for line in art_lines:
-            colored_line: str = ''
-            for char in line:
-                color: str = random.choice(colors)
-                colored_line += color + char
-            colored_lines.append(colored_line + '\033[0m')  # Reset color
+        :param font: Font to use
+        :return: Function mapping text to rainbow-styled ASCII art
+        """
+        colors = _RAINBOW_COLORS
+        reset = _RESET
+        choices = random.choices
+        
+        def render(text: str) -> str:
+            _, art_lines, _ = _render_cached(font, text)
+            
+            colored_lines: List[str] = []
+            for line in art_lines:
+                if not line or line.isspace():
+                    # Nothing visible to colour; skip the escape codes
+                    colored_lines.append(line)
+                    continue
+                # One RNG call per line instead of one per character
+                picks: List[str] = choices(colors, k=len(line))
+                parts: List[str] = [color + char for color, char in zip(picks, line)]
+                colored_lines.append(''.join(parts) + reset)
+            
+            return '\n'.join(colored_lines)
         
-        return '\n'.join(colored_lines)
+        return render
     
     @staticmethod
     def glitch_effect(text: str, font: ZeroArtFont, glitch_intensity: float = 0.1) -> str:
@@ -50,20 +176,20 @@ class AsciiArtEffects:
         :param glitch_intensity: Probability of character distortion
         :return: Glitched ASCII art
         """
-        art: str = font.render(text)
-        art_lines: List[str] = art.split('\n')
-        
-        glitched_lines: List[str] = []
+        art, art_lines, _ = _render_cached(font, text)
         glitch_chars: List[str] = ['~', '^', '`', '¯', '±']
         
-        for line in art_lines:
-            glitched_line: str = ''
-            for char in line:
-                if random.random() < glitch_intensity:
-                    glitched_line += random.choice(glitch_chars)
-                else:
-                    glitched_line += char
-            glitched_lines.append(glitched_line)
+        if glitch_intensity <= 0:
+            # Effect disabled; nothing to distort
+            return art
+        if glitch_intensity < 1:
+            return _glitch_sparse(art, glitch_chars, glitch_intensity)
+        
+        # Every character is replaced, so only the replacements need drawing
+        choices = random.choices
+        glitched_lines: List[str] = [
+            ''.join(choices(glitch_chars, k=len(line))) for line in art_lines
+        ]
         
         return '\n'.join(glitched_lines)
 
@@ -88,17 +214,14 @@ class AsciiArtEffects:
         :param outline_char: Character to use for outline
         :return: ASCII art with outline
         """
-        art: str = font.render(text)
-        art_lines: List[str] = art.split('\n')
-        
-        outlined_lines: List[str] = []
-        for line in art_lines:
-            outlined_line: str = outline_char + line + outline_char
-            outlined_lines.append(outlined_line)
+        _, art_lines, max_width = _render_cached(font, text)
         
-        top_bottom_line: str = outline_char * (len(outlined_lines[0]))
+        # Border spans the widest line plus the two side characters
+        width: int = max_width + 2 * len(outline_char)
+        top_bottom_line: str = outline_char * width
+        outlined_lines: List[str] = [outline_char + line + outline_char for line in art_lines]
         
-        return '\n'.join([top_bottom_line] + outlined_lines + [top_bottom_line])
+        return '\n'.join((top_bottom_line, *outlined_lines, top_bottom_line))
 
     @staticmethod
     def gradient_effect(text: str, font: ZeroArtFont, color1: tuple = (255, 0, 0), color2: tuple = (0, 0, 255)) -> str:
@@ -111,22 +234,15 @@ class AsciiArtEffects:
         :param color2: Ending RGB color
         :return: Gradient-styled ASCII art
         """
-        art: str = font.render(text)
-        art_lines: List[str] = art.split('\n')
-        
-        gradient_lines: List[str] = []
-        num_lines = len(art_lines)
-        
-        for i, line in enumerate(art_lines):
-            # Calculate interpolated color
-            ratio = i / max(1, num_lines - 1)
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            
-            # Apply ANSI color
-            colored_line = f'\033[38;2;{r};{g};{b}m{line}\033[0m'
-            gradient_lines.append(colored_line)
+        _, art_lines, _ = _render_cached(font, text)
+        
+        prefixes = _gradient_prefixes(tuple(color1), tuple(color2), len(art_lines))
+        
+        # Apply ANSI color
+        gradient_lines: List[str] = [
+            line if not line or line.isspace() else prefix + line + _RESET
+            for prefix, line in zip(prefixes, art_lines)
+        ]
             
         return '\n'.join(gradient_lines)
 
@@ -140,12 +256,16 @@ class AsciiArtEffects:
         :param bounce_height: Height of the bounce
         :return: Bouncing ASCII art
         """
-        art: str = font.render(text)
-        art_lines: List[str] = art.split('\n')
+        _, art_lines, _ = _render_cached(font, text)
+        
+        # The offset repeats every 2 * bounce_height lines, so build each
+        # distinct padding string once
+        period = 2 * bounce_height
+        cycle = abs(period)
+        pads = tuple(" " * abs(bounce_height - k % period) for k in range(cycle))
+        
+        bouncing_lines: List[str] = [
+            pads[i % cycle] + line for i, line in enumerate(art_lines)
+        ]
         
-        bouncing_lines: List[str] = []
-        for i, line in enumerate(art_lines):
-            offset = abs(bounce_height - i % (2 * bounce_height))
-            bouncing_lines.append(" " * offset + line)
-            
         return '\n'.join(bouncing_lines)
\ No newline at end of file